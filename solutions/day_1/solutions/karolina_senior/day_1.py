@@ -3,114 +3,207 @@ Advent of code 2023 - day 1
 """
 
 
+# Imports
+# ------------------------------------------------------------------------------
+
+import mmap
+import os
+
+import numpy as np
+
+
 # Reading a file
 # ------------------------------------------------------------------------------
 
 PATH = r"input_1.txt"
-file = open(PATH, "r", encoding="utf-8").read()
-file = file.split("\n")
-file = [elem for elem in file if len(elem) > 0]
+
+# size of the block of the file processed at once in bytes
+BLOCK_SIZE = 2**26
+
+MAP_DIC = {
+    "one": 1,
+    "two": 2,
+    "three": 3,
+    "four": 4,
+    "five": 5,
+    "six": 6,
+    "seven": 7,
+    "eight": 8,
+    "nine": 9,
+    "1": 1,
+    "2": 2,
+    "3": 3,
+    "4": 4,
+    "5": 5,
+    "6": 6,
+    "7": 7,
+    "8": 8,
+    "9": 9,
+}
 
 
 # Functions definition
 # ------------------------------------------------------------------------------
 
 
-def _find_type(row: str, key: str, right: bool) -> int:
+def _to_matrix(row_list: list) -> np.ndarray:
     """
-    Function returning proper find method applied on row to search for key\
-    depending of direction parameter right
+    Converts list of rows into a matrix of bytes, one row per line,\
+    with shorter rows padded with zero bytes
 
-    Parameters:
-    row: str
-        text to search for the key
-    key: str
-        value to be founded in the row
-    right: bool
-        direction of searching
+    Parameters
+    ----------
+    row_list: list
+        list of ascii rows
 
     Returns
-    str.method(str) -> int:
-        result of proper find method depending of right parameter returning\
-        location of the key in row if exist or -1 if not present
-        - rfind if right is True
-        - find if right is False
+    -------
+    matrix: np.ndarray
+        uint8 matrix of shape (number of rows, length of the longest row)
     """
 
-    return row.rfind(key) if right is True else row.find(key)
+    width = max((len(row) for row in row_list), default=0)
+    data = "".join(row.ljust(width, "\0") for row in row_list).encode("ascii")
+
+    return np.frombuffer(data, dtype=np.uint8).reshape(len(row_list), width)
 
 
-def get_indexes(row_list: list, right: bool):
+def get_edge_digits(row_list: list) -> tuple:
     """
-    Returns list of first locations of word or numerical digits from 1 to 9 per each row,\
-    considering direction predefined by right parameter
+    Returns first and last word or numerical digit from 1 to 9 for all the rows at once.\
+    For each key all rows are searched together - positions where the key starts are\
+    found by comparing shifted columns of the byte matrix with consecutive key bytes,\
+    and the earliest / latest key position per row wins
 
     Parameters
     ----------
     row_list: list
         list of rows to search digits in
-    right: bool
-        direction of searching
 
     Returns
     -------
-    key_loc: list
-        list of first or last occurence of any of 1-9 digits per each row in row_list
+    first_digit, last_digit: tuple[np.ndarray, np.ndarray]
+        first and last occurence of any of 1-9 digits per each row in row_list
+    """
+
+    matrix = _to_matrix(row_list)
+    rows, width = matrix.shape
+
+    first_loc = np.full(rows, width)
+    last_loc = np.full(rows, -1)
+    first_digit = np.zeros(rows, dtype=np.int64)
+    last_digit = np.zeros(rows, dtype=np.int64)
+
+    for key, value in MAP_DIC.items():
+        size = len(key)
+        if size > width:
+            continue
+
+        # found[row, i] is True if the key starts at position i of the row
+        found = np.ones((rows, width - size + 1), dtype=bool)
+        for offset, byte in enumerate(key.encode("ascii")):
+            found &= matrix[:, offset : width - size + 1 + offset] == byte
+
+        present = found.any(axis=1)
+        first = np.where(present, found.argmax(axis=1), width)
+        last = np.where(present, width - size - found[:, ::-1].argmax(axis=1), -1)
+
+        earlier = first < first_loc
+        first_loc[earlier] = first[earlier]
+        first_digit[earlier] = value
+
+        later = last > last_loc
+        last_loc[later] = last[later]
+        last_digit[later] = value
+
+    return first_digit, last_digit
+
+
+def _sum_block_digits(data: np.ndarray) -> int:
+    """
+    Sums numbers made of first and last numerical digit of each line in the block\
+    of bytes, without creating strings - digit positions are found with a mask and\
+    matched to line boundaries (newline offsets) with binary search
+
+    Parameters
+    ----------
+    data: np.ndarray
+        uint8 array with complete lines of the file
+
+    Returns
+    -------
+    total: int
+        sum of two digit numbers of all the lines containing a digit
+    """
+
+    newlines = np.flatnonzero(data == ord("\n"))
+    starts = np.concatenate(([0], newlines + 1))
+    ends = np.append(newlines, data.size)
+
+    digits = np.flatnonzero((data >= ord("0")) & (data <= ord("9")))
+    first = np.searchsorted(digits, starts)
+    last = np.searchsorted(digits, ends) - 1
+
+    # line has a digit if the first digit after its start is before its end
+    present = first <= last
+    tens = data[digits[first[present]]].astype(np.int64) - ord("0")
+    units = data[digits[last[present]]].astype(np.int64) - ord("0")
+
+    return int((10 * tens + units).sum())
+
+
+def sum_edge_digits(path: str) -> int:
+    """
+    Returns sum of numbers made of first and last numerical digit of each line of the file.\
+    File is memory-mapped and processed in blocks ending on line boundaries,\
+    so memory usage does not depend on the size of the file
+
+    Parameters
+    ----------
+    path: str
+        path to the input file
+
+    Returns
+    -------
+    total: int
+        sum of two digit numbers of all the lines
     """
 
-    map_dic = {
-        "one": 1,
-        "two": 2,
-        "three": 3,
-        "four": 4,
-        "five": 5,
-        "six": 6,
-        "seven": 7,
-        "eight": 8,
-        "nine": 9,
-        "1": 1,
-        "2": 2,
-        "3": 3,
-        "4": 4,
-        "5": 5,
-        "6": 6,
-        "7": 7,
-        "8": 8,
-        "9": 9,
-    }
-
-    location = [
-        [_find_type(row, key, right) for key in map_dic if _find_type(row, key, right) != -1]
-        for row in row_list
-    ]
-    key_name = [
-        [key for key in map_dic if _find_type(row, key, right) != -1] for row in row_list
-    ]
-
-    # Rearange results
-    order = [sorted(range(len(row)), key=lambda i: row[i]) for row in location]
-    key_name = [[key[i] for i in order[idx]] for idx, key in enumerate(key_name)]
-
-    key_loc = [row[-int(right)] for row in key_name]
-    key_loc = [map_dic[key] for key in key_loc]
-
-    return key_loc
+    total = 0
+
+    # empty file cannot be memory-mapped
+    if os.path.getsize(path) == 0:
+        return total
+
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        start = 0
+        while start < len(mm):
+            end = mm.find(b"\n", start + BLOCK_SIZE)
+            end = len(mm) if end == -1 else end + 1
+
+            block = np.frombuffer(mm, dtype=np.uint8, count=end - start, offset=start)
+            total += _sum_block_digits(block)
+            # array has to be released before the map is closed
+            del block
+            start = end
+
+    return total
 
 
 # Part 1
 # ------------------------------------------------------------------------------
 
-start = [[digit for digit in list(elem) if digit.isdigit()][0] for elem in file]
-stop = [[digit for digit in list(elem) if digit.isdigit()][-1] for elem in file]
-output = ["".join([a, b]) for a, b in zip(start, stop)]
-print(f"Part 1: {sum((int(elem) for elem in output))}")
+print(f"Part 1: {sum_edge_digits(PATH)}")
 
 
 # Part 2
 # ------------------------------------------------------------------------------
 
-key_start = get_indexes(file, False)
-key_end = get_indexes(file, True)
-key_values = ["".join([str(start), str(end)]) for start, end in zip(key_start, key_end)]
+# lines are read only after part 1, which never needs them as strings
+with open(PATH, "r", encoding="utf-8") as f:
+    file = [elem for elem in f.read().split("\n") if len(elem) > 0]
+
+key_start, key_end = get_edge_digits(file)
+key_values = 10 * key_start + key_end
 
-print(f"Part 2: {str(sum((int(elem) for elem in key_values)))}")
+print(f"Part 2: {int(key_values.sum())}")
@@ -1,7 +1,10 @@
 import argparse
+import mmap
 import os
 import re
-from typing import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from itertools import pairwise, repeat
+from typing import Iterable, Optional
 import time
 
 PATH = os.path.join(os.path.dirname(__file__), "input.txt")
@@ -25,6 +28,28 @@ REGEX = {
     2: re.compile(r"(?=({0}|\d))".format("|".join(MAPPING.keys()))),
 }
 
+# value of the digit by its bytes representation - both digits and words
+BYTES_DIGITS = {
+    **{str(value).encode(): value for value in range(10)},
+    **{word.encode(): int(digit) for word, digit in MAPPING.items()},
+}
+
+# digit to find in the line of bytes for specific part of the problem
+BYTES_PATTERNS = {
+    1: rb"\d",
+    2: b"|".join([word.encode() for word in MAPPING] + [rb"\d"]),
+}
+
+# regex matching a line of bytes with its first and last digit in groups,
+# lookaheads allow words of the first and the last digit to overlap ("twone")
+BYTES_REGEX = {
+    part: re.compile(rb"(?m)^.*?(?=(%s)).*(?=(%s))" % (pattern, pattern))
+    for part, pattern in BYTES_PATTERNS.items()
+}
+
+# number of chunks processed by each worker - smaller chunks balance the load
+CHUNKS_PER_WORKER = 4
+
 parser = argparse.ArgumentParser(description="Part of the daily problem")
 parser.add_argument(
     "-p",
@@ -33,6 +58,14 @@ parser.add_argument(
     type=int,
     help="Part of the daily problem - 1 or 2",
 )
+parser.add_argument(
+    "-w",
+    "--workers",
+    default=None,
+    type=int,
+    help="Number of processes summing memory-mapped chunks of the input, "
+    "by default input is read in a single process",
+)
 
 
 def calculate_score(input: Iterable) -> int:
@@ -50,7 +83,94 @@ def calculate_score(input: Iterable) -> int:
     return sum(map(lambda x: int(f"{x[0]}{x[-1]}"), input))
 
 
-def main(part: int = 1):
+def get_chunks(data: mmap.mmap, n_chunks: int) -> list[tuple[int, int]]:
+    """
+    Splits memory-mapped file into byte ranges of similar size
+    that start and end on line boundaries.
+
+    Parameters:
+    - data (mmap.mmap): Memory-mapped input file.
+    - n_chunks (int): Requested number of chunks.
+
+    Returns:
+    - list[tuple[int, int]]: Start (inclusive) and end (exclusive) offsets of chunks.
+    """
+    size = len(data)
+    bounds = [0]
+
+    for i in range(1, n_chunks):
+        newline = data.find(b"\n", max(size * i // n_chunks, bounds[-1]))
+        if newline == -1:
+            break
+        bounds.append(newline + 1)
+
+    bounds.append(size)
+    return [(start, end) for start, end in pairwise(bounds) if start < end]
+
+
+def calculate_chunk_score(path: str, part: int, start: int, end: int) -> int:
+    """
+    Calculates a score of the lines in the byte range of the memory-mapped file.
+    Only pages of the range are read, so the file may be larger than memory.
+
+    Parameters:
+    - path (str): Path to the input file.
+    - part (int): Part of the daily problem - 1 or 2.
+    - start (int): Offset of the first byte of the chunk.
+    - end (int): Offset after the last byte of the chunk.
+
+    Returns:
+    - int: The calculated score of the chunk.
+    """
+    regex = BYTES_REGEX[part]
+    score = 0
+
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        matches = regex.finditer(data, start, end)
+        try:
+            for match in matches:
+                first, last = match.group(1, 2)
+                score += 10 * BYTES_DIGITS[first] + BYTES_DIGITS[last]
+        finally:
+            # matches export the buffer of the map, which can't be closed while they exist
+            match = matches = None
+
+    return score
+
+
+def calculate_parallel_score(path: str, part: int, workers: Optional[int] = None) -> int:
+    """
+    Calculates a score of the file by splitting it into line-aligned chunks
+    summed in a pool of processes and combining the partial sums.
+
+    Parameters:
+    - path (str): Path to the input file.
+    - part (int): Part of the daily problem - 1 or 2.
+    - workers (int, optional): Number of processes, by default number of CPUs.
+
+    Returns:
+    - int: The calculated score.
+    """
+    if os.path.getsize(path) == 0:
+        return 0
+
+    workers = workers or os.cpu_count() or 1
+
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        chunks = get_chunks(data, n_chunks=workers * CHUNKS_PER_WORKER)
+
+    starts, ends = zip(*chunks)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return sum(
+            executor.map(calculate_chunk_score, repeat(path), repeat(part), starts, ends)
+        )
+
+
+def main(part: int = 1, workers: Optional[int] = None):
+    if workers is not None:
+        print(calculate_parallel_score(PATH, part=part, workers=workers))
+        return
+
     with open(PATH) as f:
         lines = map(lambda x: x.strip(), f.readlines())
 
@@ -68,5 +188,5 @@ def main(part: int = 1):
 if __name__ == "__main__":
     tic = time.perf_counter()
     args = parser.parse_args()
-    main(part=args.part)
+    main(part=args.part, workers=args.workers)
     print(f"Time elapsed: {time.perf_counter() - tic:0.8f} seconds")
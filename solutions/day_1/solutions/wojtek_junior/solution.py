@@ -1,8 +1,7 @@
 """Solution to the day 1 of Advent of Code"""
 
 import argparse
-import re
-from typing import Literal, Pattern
+from typing import Iterable, Literal
 
 __author__ = "Wojtek Junior"
 
@@ -21,11 +20,10 @@ REPLACES = {
     "nine": "9",
 }
 
-# regex to finall digits for specific part of the problem
-REGEX: dict[int, Pattern] = {
-    1: re.compile(r"\d"),
-    2: re.compile(r"(?=(one|two|three|four|five|six|seven|eight|nine|\d))"),
-}
+DIGITS = {digit: digit for digit in "0123456789"}
+
+# key marking the end of the word in the trie node
+END = ""
 
 
 parser = argparse.ArgumentParser(description="Part of the daily problem")
@@ -38,7 +36,83 @@ parser.add_argument(
 )
 
 
-def get_number(line: str, pattern: Pattern) -> int:
+class DigitScanner:
+    """
+    Class finding the first and the last digit in the line, where digit is any
+    of the keys of the mapping (e.g. "7" or "seven").
+
+    Keys are compiled into two tries - one of the keys and one of the reversed keys.
+    Line is scanned forward from the start until the first match and backward
+    from the end until the last match, so not all the matches are found.
+    Scanning from each position ends as soon as the trie has no matching branch.
+    """
+
+    def __init__(self, mapping: dict[str, str]) -> None:
+        """
+        Initializes the DigitScanner.
+
+        Parameters
+        ----------
+        mapping : dict[str, str]
+            Dictionary mapping the digit representation to the digit.
+        """
+        self._forward = self._build(mapping)
+        self._backward = self._build({key[::-1]: value for key, value in mapping.items()})
+
+    @staticmethod
+    def _build(mapping: dict[str, str]) -> dict:
+        """Builds a trie of nested dicts with digit values stored under the END key."""
+        root: dict = {}
+
+        for key, value in mapping.items():
+            node = root
+            for char in key:
+                node = node.setdefault(char, {})
+            node[END] = value
+
+        return root
+
+    @staticmethod
+    def _scan(trie: dict, line: str, positions: Iterable[int], step: int) -> str:
+        """
+        Returns the value of the first key found in the line, trying positions
+        in the given order and reading characters in the direction of the step.
+        """
+        size = len(line)
+
+        for start in positions:
+            node = trie.get(line[start])
+            index = start
+
+            while node is not None:
+                value = node.get(END)
+                if value is not None:
+                    return value
+
+                index += step
+                if not 0 <= index < size:
+                    break
+                node = node.get(line[index])
+
+        raise ValueError(f"No digit found in the line: '{line}'")
+
+    def first(self, line: str) -> str:
+        """Returns the first digit of the line."""
+        return self._scan(self._forward, line, range(len(line)), step=1)
+
+    def last(self, line: str) -> str:
+        """Returns the last digit of the line."""
+        return self._scan(self._backward, line, range(len(line) - 1, -1, -1), step=-1)
+
+
+# scanners of digits for specific part of the problem
+SCANNERS: dict[int, DigitScanner] = {
+    1: DigitScanner(DIGITS),
+    2: DigitScanner({**DIGITS, **REPLACES}),
+}
+
+
+def get_number(line: str, scanner: DigitScanner) -> int:
     """
     Extracts int from a string that is constructed by taking
     the first occurence of digit and the last occurence of digit in this order.
@@ -47,17 +121,15 @@ def get_number(line: str, pattern: Pattern) -> int:
     ----------
     line : str
         Line of the input file.
-    pattern : Pattern
-        Compiled regex pattern for finding number.
+    scanner : DigitScanner
+        Scanner finding digits for the part of the problem.
 
     Returns
     -------
     int
         Extracted int number from the line.
     """
-    matches = pattern.findall(line)
-    matches = [REPLACES.get(m, m) for m in matches]
-    return int(f"{matches[0]}{matches[-1]}")
+    return int(f"{scanner.first(line)}{scanner.last(line)}")
 
 
 def main(part: PART) -> int:
@@ -78,11 +150,11 @@ def main(part: PART) -> int:
     with open(INPUT, "r") as f:
         lines = f.readlines()
 
-    pattern = REGEX.get(part)
-    if pattern is None:
+    scanner = SCANNERS.get(part)
+    if scanner is None:
         raise ValueError(f"Invalid part of the problem: '{part}', must be 1 or 2.")
 
-    return sum(get_number(line=line, pattern=pattern) for line in lines)
+    return sum(get_number(line=line, scanner=scanner) for line in lines)
 
 
 if __name__ == "__main__":
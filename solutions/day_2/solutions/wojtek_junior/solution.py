@@ -7,10 +7,17 @@ import re
 from dataclasses import dataclass
 from typing import Iterable, Literal
 
+import numpy as np
+
 __author__ = "Wojtek Junior"
 
 INPUT = "input.txt"
 PART = Literal[1, 2]
+# possible methods to use for the solution
+# store - games parsed into arrays and evaluated with vectorized operations
+#         part 1 is answered from FeasibilityIndex built over the games
+# objects - games parsed into CubeGame objects with list of CubesMove
+METHOD = Literal["store", "objects"]
 
 parser = argparse.ArgumentParser(description="Part of the daily problem")
 parser.add_argument(
@@ -20,6 +27,13 @@ parser.add_argument(
     type=int,
     help="Part of the daily problem - 1 or 2",
 )
+parser.add_argument(
+    "-m",
+    "--method",
+    default="store",
+    type=str,
+    help="Method to use for the solution - one of: 'store' or 'objects'",
+)
 
 # game suffix regex - to extract id of the game
 SUFFIX = re.compile(r"^Game (\d+):")
@@ -29,6 +43,11 @@ COLOR = re.compile(r"(red|blue|green)")
 # extact the number form group 1 and color from group 2
 NUMBER = re.compile(r"(\d+) (red|blue|green)")
 
+# index of the color in arrays of GameStore by the first letter of the color
+# same order as fields of CubesMove - blue, green, red
+COLORS = np.zeros(256, dtype=np.int64)
+COLORS[[ord("b"), ord("g"), ord("r")]] = [0, 1, 2]
+
 
 @dataclass
 class CubeGame:
@@ -125,6 +144,253 @@ class CubesMove:
         )
 
 
+@dataclass
+class GameStore:
+    """
+    Class storing all the games as arrays of numbers (struct of arrays)
+    instead of CubeGame objects, so games can be parsed and evaluated all at once.
+    Columns of 2-dimensional arrays are colors in order of COLORS.
+
+    Parameters
+    ----------
+    ids : np.ndarray
+        Ids of the games, shape (n_games,).
+    maxima : np.ndarray
+        Maximum number of cubes of each color in any move of the game,
+        shape (n_games, 3).
+    moves : np.ndarray
+        Number of cubes of each color in moves of all the games,
+        shape (n_moves, 3).
+    offsets : np.ndarray
+        Index of the first move of each game in moves array followed by
+        total number of moves, shape (n_games + 1,).
+    """
+
+    ids: np.ndarray
+    maxima: np.ndarray
+    moves: np.ndarray
+    offsets: np.ndarray
+
+    @classmethod
+    def from_bytes(cls, text: bytes) -> GameStore:
+        """
+        Parses the input into the GameStore in a single vectorized pass over its bytes,
+        without creating any objects per game, move or cube.
+
+        Every run of digits is a number - game id if followed by ':',
+        number of cubes otherwise, with the color starting after the following space.
+        Moves start at game ids and at ';' separators, so each number of cubes
+        is assigned to the last move started before it.
+
+        Parameters
+        ----------
+        text : bytes
+            Content of the input file with game descriptions.
+
+        Returns
+        -------
+        GameStore
+            GameStore with all the games from the input.
+        """
+        data = np.frombuffer(text, dtype=np.uint8)
+        starts, ends, values = find_numbers(data)
+
+        last = data.size - 1
+        is_id = data[np.minimum(ends, last)] == ord(":")
+        is_cube = ~is_id
+
+        id_positions = starts[is_id]
+        move_starts = np.sort(
+            np.concatenate([np.flatnonzero(data == ord(";")), id_positions])
+        )
+        move_index = np.searchsorted(move_starts, starts[is_cube], side="right") - 1
+        color = COLORS[data[np.minimum(ends[is_cube] + 1, last)]]
+
+        moves = np.zeros((move_starts.size, 3), dtype=np.int64)
+        moves[move_index, color] = values[is_cube]
+
+        offsets = np.searchsorted(move_starts, id_positions)
+        maxima = (
+            np.maximum.reduceat(moves, offsets, axis=0)
+            if offsets.size
+            else np.zeros((0, 3), dtype=np.int64)
+        )
+        return cls(
+            ids=values[is_id],
+            maxima=maxima,
+            moves=moves,
+            offsets=np.append(offsets, move_starts.size),
+        )
+
+    def is_possible(self, config: CubesMove) -> np.ndarray:
+        """
+        Checks which of the games are possible to happen with the configuration
+        of cubes. See CubeGame.is_possible.
+
+        Parameters
+        ----------
+        config : CubesMove
+            CubesMove configuration to check against.
+
+        Returns
+        -------
+        np.ndarray
+            Boolean array, True for games possible to happen.
+        """
+        available = np.array([config.blue, config.green, config.red])
+        return (self.maxima <= available).all(axis=1)
+
+    @property
+    def power(self) -> np.ndarray:
+        """
+        Calculates the power of all the games. See CubeGame.power.
+
+        Returns
+        -------
+        np.ndarray
+            Array with power of each game.
+        """
+        return self.maxima.prod(axis=1)
+
+
+@dataclass
+class FeasibilityIndex:
+    """
+    Class answering queries for sum of ids of games possible to happen
+    with the given configuration of cubes, without scanning all the games per query.
+
+    Index is a 3-dimensional prefix sum table of game ids over compressed
+    maxima of each color - cell (i, j, k) is the sum of ids of games with
+    maximum number of blue cubes below i-th distinct blue maximum, green below
+    j-th distinct green maximum and red below k-th distinct red maximum.
+    Query is then a binary search of each color in its distinct maxima
+    and a single lookup in the table.
+    Size of the table is the product of the number of distinct maxima of each color.
+
+    Parameters
+    ----------
+    levels : tuple[np.ndarray, np.ndarray, np.ndarray]
+        Sorted distinct maxima of each color in order of COLORS.
+    table : np.ndarray
+        Prefix sum table of ids of the games,
+        shape (len(levels[0]) + 1, len(levels[1]) + 1, len(levels[2]) + 1).
+    """
+
+    levels: tuple[np.ndarray, np.ndarray, np.ndarray]
+    table: np.ndarray
+
+    @classmethod
+    def from_store(cls, store: GameStore) -> FeasibilityIndex:
+        """
+        Builds the index from maxima of all the games in the GameStore.
+
+        Parameters
+        ----------
+        store : GameStore
+            GameStore with all the games.
+
+        Returns
+        -------
+        FeasibilityIndex
+            Index of the games from the store.
+        """
+        levels = tuple(np.unique(store.maxima[:, color]) for color in range(3))
+        # rank of the maximum among distinct maxima of the color, 0 is left for padding
+        ranks = tuple(
+            np.searchsorted(levels[color], store.maxima[:, color]) + 1 for color in range(3)
+        )
+
+        table = np.zeros(tuple(level.size + 1 for level in levels), dtype=np.int64)
+        np.add.at(table, ranks, store.ids)
+
+        for axis in range(3):
+            np.cumsum(table, axis=axis, out=table)
+
+        return cls(levels=levels, table=table)  # type: ignore
+
+    def query(self, config: CubesMove) -> int:
+        """
+        Calculates sum of ids of the games possible to happen with the configuration
+        of cubes. See GameStore.is_possible.
+
+        Parameters
+        ----------
+        config : CubesMove
+            CubesMove configuration to check against.
+
+        Returns
+        -------
+        int
+            Sum of ids of the games possible to happen.
+        """
+        budgets = np.array([[config.blue, config.green, config.red]])
+        return int(self.query_many(budgets)[0])
+
+    def query_many(self, budgets: np.ndarray) -> np.ndarray:
+        """
+        Calculates sum of ids of the games possible to happen
+        for many configurations of cubes at once.
+
+        Parameters
+        ----------
+        budgets : np.ndarray
+            Available number of cubes of each color in order of COLORS,
+            one configuration per row, shape (n_queries, 3).
+
+        Returns
+        -------
+        np.ndarray
+            Sum of ids of the games possible to happen for each configuration,
+            shape (n_queries,).
+
+        Raises
+        ------
+        ValueError
+            If budgets are not of shape (n_queries, 3).
+        """
+        budgets = np.asarray(budgets)
+
+        if budgets.ndim != 2 or budgets.shape[1] != 3:
+            raise ValueError(f"Invalid shape of budgets: {budgets.shape}, must be (n, 3).")
+
+        # number of distinct maxima of each color not exceeding the budget
+        index = tuple(
+            np.searchsorted(self.levels[color], budgets[:, color], side="right")
+            for color in range(3)
+        )
+        return self.table[index]
+
+
+def find_numbers(data: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Finds all runs of digits in the bytes and parses them into numbers at once.
+
+    Parameters
+    ----------
+    data : np.ndarray
+        uint8 array with bytes of the input.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray, np.ndarray]
+        Start, end (exclusive) and value of each number, in order of the input.
+    """
+    is_digit = ((data >= ord("0")) & (data <= ord("9"))).view(np.int8)
+
+    edges = np.diff(is_digit, prepend=0, append=0)
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    lengths = ends - starts
+
+    # numbers are built digit by digit, all of them at once
+    values = np.zeros(starts.size, dtype=np.int64)
+    for k in range(int(lengths.max(initial=0))):
+        longer = lengths > k
+        values[longer] = values[longer] * 10 + data[starts[longer] + k] - ord("0")
+
+    return starts, ends, values
+
+
 def get_game_id(line: str) -> int:
     """
     Extracts id of the game from the line.
@@ -192,7 +458,7 @@ def get_game(line: str) -> CubeGame:
     return CubeGame(id=id_, moves=moves)
 
 
-def main(part: PART) -> int:
+def main(part: PART, method: METHOD = "store") -> int:
     """
     Calculates the solution to the problem from Day 2.
 
@@ -200,6 +466,8 @@ def main(part: PART) -> int:
     ----------
     part : PART
         Part of the daily problem - 1 or 2.
+    method : METHOD
+        Method to use for the solution - one of: 'store' or 'objects', by default "store".
 
     Returns
     -------
@@ -207,19 +475,28 @@ def main(part: PART) -> int:
         Solution to the problem.
     """
 
-    with open(INPUT, "r") as f:
-        lines = f.readlines()
+    with open(INPUT, "rb") as f:
+        text = f.read()
 
-    games = [get_game(line) for line in lines]
+    if part not in (1, 2):
+        raise ValueError(f"Invalid part of the problem: '{part}', must be 1 or 2.")
 
-    if part == 1:
-        return sum(game.id for game in games if game.is_possible(CONFIG))
+    if method == "store":
+        store = GameStore.from_bytes(text)
 
-    elif part == 2:
+        if part == 1:
+            return FeasibilityIndex.from_store(store).query(CONFIG)
+        return int(store.power.sum())
+
+    elif method == "objects":
+        games = [get_game(line) for line in text.decode().splitlines()]
+
+        if part == 1:
+            return sum(game.id for game in games if game.is_possible(CONFIG))
         return sum(game.power for game in games)
 
     else:
-        raise ValueError(f"Invalid part of the problem: '{part}', must be 1 or 2.")
+        raise ValueError(f"Unknown method: {method}, choose one of: 'store' or 'objects'")
 
 
 # global configuration of cubes to check against - for 1 part of the problem
@@ -229,5 +506,5 @@ CONFIG = CubesMove(blue=14, green=13, red=12)
 
 if __name__ == "__main__":
     args = parser.parse_args()
-    result = main(part=args.part)
+    result = main(part=args.part, method=args.method)
     print(result)
@@ -1,95 +1,298 @@
 import numpy as np
-import re
+import argparse
 import os
+import re
+from itertools import chain
+from typing import Iterable, Iterator
 
 PATH = os.path.join(os.path.dirname(__file__), "input.txt")
-with open(PATH) as f:
-    lines = [line.rstrip("\n") for line in f]
-
-
-# randomly copied from stackoverflow/numpy which allows to pad to np.array with strings
-def pad_with(vector, pad_width, iaxis, kwargs):
-    pad_value = kwargs.get("padder", "?")
-    vector[: pad_width[0]] = pad_value
-    vector[-pad_width[1] :] = pad_value
-    return vector
-
-
-def number_close_to_character(num: re.Match, ex: re.Match, n_cols: int = 10) -> bool:
-    """with padding we dont care now about the edges, so we can just check if the number is close to the special character"""
-    ex_index = ex.span()[0]
-    for i in range(num.span()[0], num.span()[1]):
-        if (
-            np.abs(i - ex_index) == n_cols
-            or np.abs(i - ex_index) == n_cols - 1
-            or np.abs(i - ex_index) == n_cols + 1
-            or np.abs(i - ex_index) == 1
-        ):
-            return 1
-    return 0
-
-
-### solution part 1
-
-# padding here
-lines = [list(i) for i in lines]
-lines = list(np.pad(lines, 1, mode=pad_with, padder="."))
-lines = ["".join(i) for i in lines]
-
-rows = len(lines)
-cols = len(lines[0])
-lines = ("").join(lines)
-special_characters = list(set([i for i in lines if not i.isalnum() and i != "."]))
-special_characters = "|".join(re.escape(x) for x in special_characters)
-special_characters = [i for i in re.finditer(special_characters, lines)]
-numbers = [i for i in re.finditer(r"\d+", lines)]
-
-
-adjacent_sum = 0
-for n in numbers:
-    find = False
-    for ex in special_characters:
-        if number_close_to_character(num=n, ex=ex, n_cols=cols):
-            find = True
-    if find:
-        continue
-    adjacent_sum = adjacent_sum + int(n[0])
-adjacent_sum
-
-
-all_number = sum([int(i[0]) for i in numbers])
-solution_p_1 = all_number - adjacent_sum
-print(f" Solution to part 1 is: {solution_p_1}")
-
-
-#### part 2
-
-# we may have some duplication but i am lazy
-
-# padding here
-lines = [list(i) for i in lines]
-lines = list(np.pad(lines, 1, mode=pad_with, padder="."))
-lines = ["".join(i) for i in lines]
-
-rows = len(lines)
-cols = len(lines[0])
-lines = ("").join(lines)
-
-# just find stars now
-stars = list(set([i for i in lines if i == "*"]))
-stars = "|".join(re.escape(x) for x in stars)
-stars = [i for i in re.finditer(stars, lines)]
-numbers = [i for i in re.finditer(r"\d+", lines)]
-
-# now looking for  EXACTLY 2 neighbours
-adjacent_sum = 0
-for ex in stars:
-    n_found = []
-    for n in numbers:
-        if number_close_to_character(num=n, ex=ex, n_cols=cols):
-            n_found.append(int(n[0]))
-    if len(n_found) == 2:
-        adjacent_sum = adjacent_sum + n_found[0] * n_found[1]
-solution_p_2 = adjacent_sum
-
-print(f" Solution to part 2 is: {solution_p_2}")
+
+parser = argparse.ArgumentParser(description="Day 3 schematic")
+parser.add_argument(
+    "-m",
+    "--method",
+    default="grid",
+    choices=["grid", "stream"],
+    help="grid - whole schematic labelled at once, stream - row by row with constant memory",
+)
+
+NUMBER = re.compile(r"\d+")
+SYMBOL = re.compile(r"[^\d.]")
+
+# offsets of the 8 neighbours in the flattened grid are computed from the number of columns
+NEIGHBOURS = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
+
+
+def to_grid(lines: list[str]) -> np.ndarray:
+    """pads the schematic with a frame of dots, so neighbours of every cell exist and we dont care about the edges"""
+    n_cols = max((len(line) for line in lines), default=0)
+    grid = np.full((len(lines) + 2, n_cols + 2), ord("."), dtype=np.uint8)
+    for i, line in enumerate(lines):
+        grid[i + 1, 1 : len(line) + 1] = np.frombuffer(line.encode(), dtype=np.uint8)
+    return grid
+
+
+def find_numbers(data: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """finds all runs of digits in the bytes at once, returns start, end (exclusive) and value of each number"""
+    is_digit = ((data >= ord("0")) & (data <= ord("9"))).view(np.int8)
+
+    edges = np.diff(is_digit, prepend=0, append=0)
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    lengths = ends - starts
+
+    # numbers are built digit by digit, all of them at once
+    values = np.zeros(starts.size, dtype=np.int64)
+    for k in range(int(lengths.max(initial=0))):
+        longer = lengths > k
+        values[longer] = values[longer] * 10 + data[starts[longer] + k] - ord("0")
+
+    return starts, ends, values
+
+
+def label_numbers(grid: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """labels each cell of the grid with the id of the number covering it (-1 for no number), returns labels and values of the numbers"""
+    flat = grid.ravel()
+    # padding guarantees numbers dont continue from one row to the next one
+    starts, ends, values = find_numbers(flat)
+
+    # digits of the numbers are consecutive cells, in the same order as the numbers
+    labels = np.full(flat.size, -1, dtype=np.int64)
+    labels[(flat >= ord("0")) & (flat <= ord("9"))] = np.repeat(
+        np.arange(starts.size), ends - starts
+    )
+
+    return labels.reshape(grid.shape), values
+
+
+def analyze_schematic(lines: list[str]) -> tuple[int, int]:
+    """single pass over the cells - each symbol looks up labels of its 8 neighbours, returns sum of part numbers and sum of gear ratios"""
+    grid = to_grid(lines)
+    labels, values = label_numbers(grid)
+    n_cols = grid.shape[1]
+    offsets = np.array([di * n_cols + dj for di, dj in NEIGHBOURS])
+
+    flat = grid.ravel()
+    is_symbol = ~((flat >= ord("0")) & (flat <= ord("9"))) & (flat != ord("."))
+    symbols = np.flatnonzero(is_symbol)
+
+    # one row per symbol, labels of the numbers around it (the same number may appear up to 3 times)
+    around = labels.ravel()[symbols[:, None] + offsets]
+
+    # part 1 - every number touching any symbol counted once
+    touched = np.unique(around[around >= 0])
+    part_sum = int(values[touched].sum())
+
+    # part 2 - stars with exactly 2 distinct numbers around
+    around = np.sort(around[flat[symbols] == ord("*")], axis=1)
+    around[:, 1:][around[:, 1:] == around[:, :-1]] = -1
+    gears = around[(around >= 0).sum(axis=1) == 2]
+    ratios = np.where(gears >= 0, values[gears], 1).prod(axis=1)
+    gear_sum = int(ratios.sum())
+
+    return part_sum, gear_sum
+
+
+def parse_row(line: str) -> tuple[list[tuple[int, int, int]], dict[int, int], dict[int, str]]:
+    """numbers of the row as (start, end, value), index of the number covering each column and symbols by column"""
+    numbers = [(m.start(), m.end(), int(m.group())) for m in NUMBER.finditer(line)]
+    covering = {
+        col: i for i, (start, end, _) in enumerate(numbers) for col in range(start, end)
+    }
+    symbols = {m.start(): m.group() for m in SYMBOL.finditer(line)}
+    return numbers, covering, symbols
+
+
+def stream_schematic(lines: Iterable[str]) -> tuple[int, int]:
+    """same as analyze_schematic but reads rows one by one and keeps only three of them - row is done when the one below arrives"""
+    part_sum, gear_sum = 0, 0
+    empty = parse_row("")
+    above, row = empty, empty
+
+    # empty row at the end, so the last row of the schematic gets its row below
+    for line in chain(lines, [""]):
+        below = parse_row(line)
+        window = (above, row, below)
+
+        for start, end, value in row[0]:
+            if any(
+                col in symbols
+                for _, _, symbols in window
+                for col in range(start - 1, end + 1)
+            ):
+                part_sum += value
+
+        for col, char in row[2].items():
+            if char != "*":
+                continue
+            around = {
+                (k, covering[c])
+                for k, (_, covering, _) in enumerate(window)
+                for c in range(col - 1, col + 2)
+                if c in covering
+            }
+            if len(around) == 2:
+                (k1, i1), (k2, i2) = around
+                gear_sum += window[k1][0][i1][2] * window[k2][0][i2][2]
+
+        above, row = row, below
+
+    return part_sum, gear_sum
+
+
+def is_symbol(char: str) -> bool:
+    return not char.isdigit() and char != "."
+
+
+class Schematic:
+    """schematic keeping both sums up to date after single cell edits - only numbers and symbols around the edited cell are touched, nothing is reparsed"""
+
+    def __init__(self, lines: list[str]):
+        self.n_rows = len(lines)
+        self.n_cols = max((len(line) for line in lines), default=0)
+        self.cells = [list(line.ljust(self.n_cols, ".")) for line in lines]
+
+        # id -> row, start, end and value of the number
+        self.numbers: dict[int, tuple[int, int, int, int]] = {}
+        self.covering: dict[tuple[int, int], int] = {}  # cell -> id of the number covering it
+        self.touching: dict[int, int] = {}  # id -> number of symbols around the number
+        self.stars: dict[tuple[int, int], set[int]] = {}  # star -> ids of numbers around it
+        self.part_sum = 0
+        self.gear_sum = 0
+        self._next_id = 0
+
+        for row, line in enumerate(self.cells):
+            for m in NUMBER.finditer("".join(line)):
+                self._add_number(row, m.start(), m.end())
+        # numbers already counted the symbols around them, only stars are left
+        for row, line in enumerate(self.cells):
+            for col, char in enumerate(line):
+                if char == "*":
+                    self.stars[(row, col)] = ids = self._numbers_around(row, col)
+                    self.gear_sum += self._ratio(ids)
+
+    def edit(self, row: int, col: int, char: str) -> None:
+        """puts the character (digit, symbol or '.') into the cell and updates both sums"""
+        if not (0 <= row < self.n_rows and 0 <= col < self.n_cols):
+            raise ValueError(f"Cell ({row}, {col}) outside of the schematic.")
+        if len(char) != 1:
+            raise ValueError(f"Expected a single character, got: '{char}'")
+
+        old = self.cells[row][col]
+        if old == char:
+            return
+        if is_symbol(old):
+            self._remove_symbol(row, col)
+
+        # numbers which may change - the one covering the cell (split or changed value)
+        # and the ones next to it (merged with the new digit)
+        affected = {self.covering.get((row, c)) for c in (col - 1, col, col + 1)}
+        for id_ in affected - {None}:
+            self._remove_number(id_)  # type: ignore
+
+        self.cells[row][col] = char
+
+        for c in range(max(col - 1, 0), min(col + 2, self.n_cols)):
+            if self.cells[row][c].isdigit() and (row, c) not in self.covering:
+                start, end = c, c + 1
+                while start > 0 and self.cells[row][start - 1].isdigit():
+                    start -= 1
+                while end < self.n_cols and self.cells[row][end].isdigit():
+                    end += 1
+                self._add_number(row, start, end)
+
+        if is_symbol(char):
+            self._add_symbol(row, col)
+
+    def _around(self, row: int, start: int, end: int) -> Iterator[tuple[int, int]]:
+        """cells of the box around columns [start, end) of the row, within the schematic"""
+        for i in range(max(row - 1, 0), min(row + 2, self.n_rows)):
+            for j in range(max(start - 1, 0), min(end + 1, self.n_cols)):
+                yield i, j
+
+    def _ratio(self, ids: set[int]) -> int:
+        if len(ids) != 2:
+            return 0
+        first, second = ids
+        return self.numbers[first][3] * self.numbers[second][3]
+
+    def _update_star(self, star: tuple[int, int], id_: int, add: bool) -> None:
+        ids = self.stars[star]
+        self.gear_sum -= self._ratio(ids)
+        if add:
+            ids.add(id_)
+        else:
+            ids.discard(id_)
+        self.gear_sum += self._ratio(ids)
+
+    def _add_number(self, row: int, start: int, end: int) -> None:
+        id_ = self._next_id
+        self._next_id += 1
+        value = int("".join(self.cells[row][start:end]))
+        self.numbers[id_] = (row, start, end, value)
+        for col in range(start, end):
+            self.covering[(row, col)] = id_
+
+        count = 0
+        for i, j in self._around(row, start, end):
+            if is_symbol(self.cells[i][j]):
+                count += 1
+            if (i, j) in self.stars:
+                self._update_star((i, j), id_, add=True)
+
+        self.touching[id_] = count
+        if count:
+            self.part_sum += value
+
+    def _remove_number(self, id_: int) -> None:
+        row, start, end, value = self.numbers[id_]
+        for i, j in self._around(row, start, end):
+            if (i, j) in self.stars:
+                self._update_star((i, j), id_, add=False)
+        for col in range(start, end):
+            del self.covering[(row, col)]
+
+        if self.touching.pop(id_):
+            self.part_sum -= value
+        del self.numbers[id_]
+
+    def _numbers_around(self, row: int, col: int) -> set[int]:
+        return {
+            self.covering[cell]
+            for cell in self._around(row, col, col + 1)
+            if cell in self.covering
+        }
+
+    def _add_symbol(self, row: int, col: int) -> None:
+        ids = self._numbers_around(row, col)
+        for id_ in ids:
+            self.touching[id_] += 1
+            if self.touching[id_] == 1:
+                self.part_sum += self.numbers[id_][3]
+
+        if self.cells[row][col] == "*":
+            self.stars[(row, col)] = ids
+            self.gear_sum += self._ratio(ids)
+
+    def _remove_symbol(self, row: int, col: int) -> None:
+        for id_ in self._numbers_around(row, col):
+            self.touching[id_] -= 1
+            if self.touching[id_] == 0:
+                self.part_sum -= self.numbers[id_][3]
+
+        if (row, col) in self.stars:
+            self.gear_sum -= self._ratio(self.stars.pop((row, col)))
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+
+    with open(PATH) as f:
+        lines = (line.rstrip("\n") for line in f)
+        if args.method == "stream":
+            solution_p_1, solution_p_2 = stream_schematic(lines)
+        else:
+            solution_p_1, solution_p_2 = analyze_schematic(list(lines))
+
+    print(f" Solution to part 1 is: {solution_p_1}")
+    print(f" Solution to part 2 is: {solution_p_2}")
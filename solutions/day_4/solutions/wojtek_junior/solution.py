@@ -2,13 +2,19 @@
 
 import argparse
 import re
-from collections import defaultdict
-from typing import Literal
+from collections import deque
+from typing import Iterable, Iterator, Literal
+
+import numpy as np
 
 __author__ = "Wojtek Junior"
 
 INPUT = "input.txt"
 PART = Literal[1, 2]
+# possible methods to use for the solution
+# bitmask - cards parsed line by line, numbers encoded as bits of python int
+# batch - all cards parsed at once into arrays of uint64 bitsets
+METHOD = Literal["bitmask", "batch"]
 
 parser = argparse.ArgumentParser(description="Part of the daily problem")
 parser.add_argument(
@@ -18,12 +24,24 @@ parser.add_argument(
     type=int,
     help="Part of the daily problem - 1 or 2",
 )
+parser.add_argument(
+    "-m",
+    "--method",
+    default="batch",
+    type=str,
+    help="Method to use for the solution - one of: 'bitmask' or 'batch'",
+)
 
 # regex for numbers in the card
 NUMBER_REGEX = re.compile(r"\d+")
 # regex for card suffix with card number
 SUFFIX = re.compile(r"Card\s*(\d+):")
 
+# numbers in the batch are stored as bits of two uint64 words - must be lower than that
+MAX_NUMBER = 128
+# number of set bits in each byte value
+POPCOUNT = np.array([bin(byte).count("1") for byte in range(256)], dtype=np.uint8)
+
 
 def get_card_number(line: str) -> int:
     """
@@ -77,12 +95,162 @@ def get_number_of_correct_guesses(winning: str, guess: str) -> int:
     guess : str
         Strings from single line of input file containing guess numbers.
     """
-    winning_list = set(NUMBER_REGEX.findall(winning))
-    guess_list = set(NUMBER_REGEX.findall(guess))
-    return len(winning_list.intersection(guess_list))
+    common = to_bitmask(winning) & to_bitmask(guess)
+    return common.bit_count()
+
+
+def to_bitmask(numbers: str) -> int:
+    """
+    Encodes whitespace separated numbers as int with the bits of the numbers set.
+
+    Parameters
+    ----------
+    numbers : str
+        Strings from single line of input file containing numbers.
+    """
+    mask = 0
+    for number in numbers.split():
+        mask |= 1 << int(number)
+    return mask
+
+
+def find_numbers(data: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Finds all runs of digits in the bytes and parses them into numbers at once.
+
+    Parameters
+    ----------
+    data : np.ndarray
+        uint8 array with bytes of the input.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray, np.ndarray]
+        Start, end (exclusive) and value of each number, in order of the input.
+    """
+    is_digit = ((data >= ord("0")) & (data <= ord("9"))).view(np.int8)
+
+    edges = np.diff(is_digit, prepend=0, append=0)
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    lengths = ends - starts
+
+    # numbers are built digit by digit, all of them at once
+    values = np.zeros(starts.size, dtype=np.int64)
+    for k in range(int(lengths.max(initial=0))):
+        longer = lengths > k
+        values[longer] = values[longer] * 10 + data[starts[longer] + k] - ord("0")
+
+    return starts, ends, values
+
+
+def get_matches_batch(text: bytes) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Calculates number of correct guesses of all the cards at once.
+    Every run of digits in the input is a number - card number if followed by ':',
+    winning number if before '|' of its card, guess number otherwise.
+    Winning and guess numbers of each card are encoded as bitsets of two uint64 words,
+    so matches are the number of set bits of their bitwise and.
+
+    Parameters
+    ----------
+    text : bytes
+        Content of the input file with the cards.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        Card numbers and number of correct guesses of each card, in order of the input.
+
+    Raises
+    ------
+    ValueError
+        If any card does not have exactly one '|' separator
+        or any number is not lower than MAX_NUMBER.
+    """
+    data = np.frombuffer(text, dtype=np.uint8)
+    starts, ends, values = find_numbers(data)
+
+    is_card = data[np.minimum(ends, data.size - 1)] == ord(":")
+    card_starts = starts[is_card]
+    bars = np.flatnonzero(data == ord("|"))
+
+    bar_cards = np.searchsorted(card_starts, bars, side="right") - 1
+    if not np.array_equal(bar_cards, np.arange(card_starts.size)):
+        raise ValueError("Each card must have exactly one '|' separator")
+
+    numbers = values[~is_card]
+    if numbers.size and numbers.max() >= MAX_NUMBER:
+        raise ValueError(f"Numbers on the cards must be lower than {MAX_NUMBER}")
+
+    positions = starts[~is_card]
+    cards = np.searchsorted(card_starts, positions, side="right") - 1
+    is_guess = (positions > bars[cards]).astype(np.int64)
+
+    # bitsets indexed by card, side (winning or guess) and word
+    bitsets = np.zeros((card_starts.size, 2, MAX_NUMBER // 64), dtype=np.uint64)
+    bits = np.left_shift(np.uint64(1), (numbers % 64).astype(np.uint64))
+    np.bitwise_or.at(bitsets, (cards, is_guess, numbers // 64), bits)
+
+    common = np.ascontiguousarray(bitsets[:, 0] & bitsets[:, 1])
+    matches = POPCOUNT[common.view(np.uint8)].sum(axis=1, dtype=np.int64)
+    return values[is_card], matches
+
+
+def iter_card_copies(matches: Iterable[int]) -> Iterator[int]:
+    """
+    Yields number of copies of each card (original included) in order of the cards,
+    based on the number of correct guesses of each card.
+
+    Each card adds its number of copies to the range of following cards,
+    which is recorded in a difference array - start of the range increases
+    the running number of won copies and the end decreases it back.
+    Difference array is a queue holding only the cards ahead which are still
+    in range of the previous ones, so cards are processed one by one
+    in a single pass, independently of how large the number of copies grows.
+
+    Parameters
+    ----------
+    matches : Iterable[int]
+        Number of correct guesses of each card, in order of the cards.
+
+    Yields
+    ------
+    int
+        Number of copies of the card.
+    """
+    # differences of the number of won copies of the following cards, from the next one
+    differences: deque[int] = deque()
+    won = 0
+
+    for correct in matches:
+        if differences:
+            won += differences.popleft()
+        copies = won + 1
+        yield copies
 
+        if correct:
+            if len(differences) < correct + 1:
+                differences.extend([0] * (correct + 1 - len(differences)))
+            differences[0] += copies
+            differences[correct] -= copies
 
-def main(part: PART) -> int:
+
+def get_card_copies(wins: dict[int, int]) -> dict[int, int]:
+    """
+    Creates and returns a dictionary with card number as key
+    and number of copies of the card (original included) as value.
+
+    Parameters
+    ----------
+    wins : dict[int, int]
+        Dictionary with card number as key and number of correct guesses as value.
+    """
+    cards = sorted(wins)
+    return dict(zip(cards, iter_card_copies(wins[card] for card in cards)))
+
+
+def main(part: PART, method: METHOD = "batch") -> int:
     """
     Calculates the solution to the day 4 of Advent of Code.
 
@@ -90,47 +258,32 @@ def main(part: PART) -> int:
     ----------
     part : PART
         Part of the daily problem - 1 or 2.
+    method : METHOD
+        Method to use for the solution - one of: 'bitmask' or 'batch', by default "batch".
 
     Returns
     -------
     int
         Solution to the problem.
     """
-    with open(INPUT, "r") as f:
-        lines = f.readlines()
+    with open(INPUT, "rb") as f:
+        text = f.read()
+
+    if method == "batch":
+        cards, matches = get_matches_batch(text)
+        wins = dict(zip(cards.tolist(), matches.tolist()))
+    elif method == "bitmask":
+        wins = get_winning_dict(text.decode().splitlines())
+    else:
+        raise ValueError(f"Unknown method: {method}, choose one of: 'bitmask' or 'batch'")
 
     if part == 1:
-        wins = get_winning_dict(lines)
         # case if there is no winning numbers - 0 points
         return sum(2 ** (correct - 1) if correct else 0 for correct in wins.values())
 
     elif part == 2:
-        scratchcards = defaultdict(int)
-        wins = get_winning_dict(lines)
-
-        def fill(card: int):
-            """
-            Recursive function to fill the scratchcard dict with number of copies
-            of each card it produces as a result, excluding the original card.
-            """
-            # range starts from one to exlude the original card
-            copies = [card + i for i in range(1, wins[card] + 1)]
-
-            for copy in copies:
-                # add one copy of the card
-                scratchcards[copy] += 1
-                # fill the scratchcard dict with copies produces as result of this copy
-                fill(copy)
-
-        for line in lines:
-            card_number = get_card_number(line)
-            # add one original card for each line
-            scratchcards[card_number] += 1
-            # fill the scratchcard dict with copies produces as result of the original card
-            fill(card_number)
-
         # sum of all cards - both original and copies
-        return sum(cards for cards in scratchcards.values())
+        return sum(get_card_copies(wins).values())
 
     else:
         raise ValueError(f"Invalid part of the problem: '{part}', must be 1 or 2.")
@@ -138,5 +291,5 @@ def main(part: PART) -> int:
 
 if __name__ == "__main__":
     args = parser.parse_args()
-    result = main(part=args.part)
+    result = main(part=args.part, method=args.method)
     print(result)
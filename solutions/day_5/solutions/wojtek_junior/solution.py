@@ -1,9 +1,14 @@
 """Solution to the day 5 of Advent of Code"""
 
+from __future__ import annotations
+
 import argparse
 import re
+from bisect import bisect_right
 from itertools import pairwise
-from typing import Any, Literal
+from typing import Any, Iterable, Literal
+
+import numpy as np
 
 __author__ = "Wojtek Junior"
 
@@ -39,15 +44,193 @@ class RangeDict(dict):
     Assumption: ranges are non-overlapping
 
     Get method is overriden to allow for the linear mapping.
+    Lookups use binary search over the ranges sorted by their start,
+    index of sorted ranges is built lazily and invalidated on every modification.
     """
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._index: tuple[list[int], list[int], list[int]] | None = None
+
+    @property
+    def index(self) -> tuple[list[int], list[int], list[int]]:
+        """
+        Sorted starts of the ranges with ends of the ranges and their shifts
+        (difference between start of the value range and the key range) in the same order.
+        """
+        if self._index is None:
+            ranges = sorted(
+                (start, end, value[0] - start) for (start, end), value in self.items()
+            )
+            self._index = (
+                [start for start, _, _ in ranges],
+                [end for _, end, _ in ranges],
+                [shift for _, _, shift in ranges],
+            )
+        return self._index
+
     def get(self, __key: int) -> int:
-        for i in self.keys():
-            if i[0] <= __key < i[1]:
-                # start of the range + linear distance from the start (+1 per unit)
-                return self[i][0] + (__key - i[0])
+        starts, ends, shifts = self.index
+        i = bisect_right(starts, __key) - 1
+        if i >= 0 and __key < ends[i]:
+            # start of the range + linear distance from the start (+1 per unit)
+            return __key + shifts[i]
         return __key
 
+    def get_many(self, __keys: np.ndarray) -> np.ndarray:
+        """
+        Vectorized version of get method, mapping all the keys at once
+        with binary search of each key in starts of the ranges.
+
+        Parameters
+        ----------
+        __keys : np.ndarray
+            Array of keys to map.
+
+        Returns
+        -------
+        np.ndarray
+            Array of mapped values (int64), same shape as keys.
+        """
+        keys = np.asarray(__keys, dtype=np.int64)
+        starts, ends, shifts = (np.asarray(a, dtype=np.int64) for a in self.index)
+        if not starts.size:
+            return keys.copy()
+
+        i = np.searchsorted(starts, keys, side="right") - 1
+        # keys before the first range are not mapped, index 0 is used just as a placeholder
+        inside = (i >= 0) & (keys < ends[np.maximum(i, 0)])
+        return keys + np.where(inside, shifts[np.maximum(i, 0)], 0)
+
+    def split(self, start: int, end: int) -> list[tuple[int, int, int]]:
+        """
+        Splits the interval of keys at the boundaries of the ranges, so each piece
+        is mapped linearly by a single range (or not mapped at all if it's outside of any range).
+
+        Parameters
+        ----------
+        start : int
+            First key of the interval.
+        end : int
+            End of the interval (exclusive).
+
+        Returns
+        -------
+        list[tuple[int, int, int]]
+            Non-empty pieces of the interval as (start, end, shift) tuples (end exclusive),
+            where shift is the difference between mapped value and the key.
+        """
+        # empty interval has no keys to map
+        if start >= end:
+            return []
+
+        starts, ends, shifts = self.index
+        pieces = []
+
+        # first range which may overlap with the interval
+        i = max(bisect_right(starts, start) - 1, 0)
+
+        # indexing instead of slicing, so ranges after the interval are never copied
+        for j in range(i, len(starts)):
+            source_start, source_end, shift = starts[j], ends[j], shifts[j]
+            if source_end <= start:
+                continue
+            if source_start >= end:
+                break
+
+            # piece before the range is not mapped
+            if start < source_start:
+                pieces.append((start, source_start, 0))
+                start = source_start
+
+            stop = min(end, source_end)
+            pieces.append((start, stop, shift))
+            start = stop
+
+        if start < end:
+            pieces.append((start, end, 0))
+        return pieces
+
+    def get_intervals(self, start: int, end: int) -> list[tuple[int, int]]:
+        """
+        Maps the whole interval of keys at once instead of key by key, see RangeDict.split.
+
+        Parameters
+        ----------
+        start : int
+            First key of the interval.
+        end : int
+            End of the interval (exclusive).
+
+        Returns
+        -------
+        list[tuple[int, int]]
+            Mapped pieces of the interval as (start, end) tuples (end exclusive).
+        """
+        return [(start + shift, end + shift) for start, end, shift in self.split(start, end)]
+
+    def _invalidate(self) -> None:
+        self._index = None
+
+    def __setitem__(self, __key: tuple[int, int], __value: tuple[int, int]) -> None:
+        super().__setitem__(__key, __value)
+        self._invalidate()
+
+    def __delitem__(self, __key: tuple[int, int]) -> None:
+        super().__delitem__(__key)
+        self._invalidate()
+
+    def __ior__(self, __value: Any) -> RangeDict:
+        self.update(__value)
+        return self
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        super().update(*args, **kwargs)
+        self._invalidate()
+
+    def setdefault(self, __key: tuple[int, int], __default: Any = None) -> Any:
+        value = super().setdefault(__key, __default)
+        self._invalidate()
+        return value
+
+    def pop(self, __key: tuple[int, int], *args: Any) -> Any:
+        value = super().pop(__key, *args)
+        self._invalidate()
+        return value
+
+    def popitem(self) -> tuple[Any, Any]:
+        item = super().popitem()
+        self._invalidate()
+        return item
+
+    def clear(self) -> None:
+        super().clear()
+        self._invalidate()
+
+
+def merge_intervals(intervals: Iterable[tuple[int, int]]) -> list[tuple[int, int]]:
+    """
+    Merges overlapping and adjacent intervals, so the same keys are not mapped twice.
+
+    Parameters
+    ----------
+    intervals : Iterable[tuple[int, int]]
+        Intervals as (start, end) tuples (end exclusive).
+
+    Returns
+    -------
+    list[tuple[int, int]]
+        Sorted, disjoint and non-adjacent intervals covering the same keys.
+    """
+    merged: list[tuple[int, int]] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
 
 class ChainDict:
     """
@@ -81,6 +264,95 @@ class ChainDict:
             key = d.get(key)
         return key
 
+    def get_many(self, __keys: np.ndarray) -> np.ndarray:
+        """
+        Vectorized version of __getitem__, mapping all the keys at once
+        through the chain, see RangeDict.get_many.
+
+        Parameters
+        ----------
+        __keys : np.ndarray
+            Array of keys to map.
+
+        Returns
+        -------
+        np.ndarray
+            Array of values retrieved from the last dictionary in the chain.
+        """
+        keys = np.asarray(__keys, dtype=np.int64)
+
+        for d in self.dicts:
+            keys = d.get_many(keys)
+        return keys
+
+    def precompose(self) -> RangeDict:
+        """
+        Composes all the dictionaries in the chain into a single RangeDict,
+        mapping keys of the first dictionary directly to values of the last one.
+        Keys are split into pieces which are mapped linearly by every dictionary
+        in the chain, so the composed mapping is linear within each of them.
+        Keys outside of all the ranges of all the dictionaries are not mapped by any of them.
+
+        Returns
+        -------
+        RangeDict
+            RangeDict equivalent to the whole chain.
+        """
+        boundaries = [bound for d in self.dicts for key in d for bound in key]
+        if not boundaries:
+            return RangeDict()
+
+        # pieces of keys of the first dictionary as (start, end, shift) tuples
+        pieces = [(min(boundaries), max(boundaries), 0)]
+
+        for d in self.dicts:
+            pieces = [
+                (start - shift, end - shift, shift + next_shift)
+                for key_start, key_end, shift in pieces
+                for start, end, next_shift in d.split(key_start + shift, key_end + shift)
+            ]
+
+        # merge neighbouring pieces with the same shift
+        merged = [pieces[0]]
+        for start, end, shift in pieces[1:]:
+            last_start, last_end, last_shift = merged[-1]
+            if last_end == start and last_shift == shift:
+                merged[-1] = (last_start, end, shift)
+            else:
+                merged.append((start, end, shift))
+
+        return RangeDict(
+            {
+                (start, end): (start + shift, end + shift)
+                for start, end, shift in merged
+                if shift
+            }
+        )
+
+    def map_intervals(self, intervals: Iterable[tuple[int, int]]) -> list[tuple[int, int]]:
+        """
+        Maps the intervals of keys through the chain, see RangeDict.get_intervals.
+        Work is proportional to the number of intervals and not to the number of keys.
+
+        Parameters
+        ----------
+        intervals : Iterable[tuple[int, int]]
+            Intervals of keys as (start, end) tuples (end exclusive).
+
+        Returns
+        -------
+        list[tuple[int, int]]
+            Sorted and merged intervals of values retrieved from the last dictionary in the chain.
+        """
+        intervals = merge_intervals(intervals)
+        for d in self.dicts:
+            # pieces of different intervals may land next to each other,
+            # merging them keeps the number of intervals from growing with every layer
+            intervals = merge_intervals(
+                piece for start, end in intervals for piece in d.get_intervals(start, end)
+            )
+        return intervals
+
 
 def get_chain_dict(categories: list[str]) -> ChainDict:
     """
@@ -147,15 +419,13 @@ def main(part: PART) -> int:
     chain = get_chain_dict(categories)
 
     if part == 1:
-        return min(chain[seed] for seed in seeds)
+        composed = chain.precompose()
+        return int(composed.get_many(np.array(seeds)).min())
 
-    #! TODO brute force - lol
     elif part == 2:
-        return min(
-            chain[number]
-            for seed, range_ in zip(seeds[::2], seeds[1::2])
-            for number in range(seed, seed + range_)
-        )
+        intervals = [(seed, seed + range_) for seed, range_ in zip(seeds[::2], seeds[1::2])]
+        # lowest location is always the start of one of the mapped intervals
+        return min(start for start, _ in chain.map_intervals(intervals))
 
     else:
         raise ValueError(f"Invalid part of the problem: '{part}', must be 1 or 2.")
@@ -1,11 +1,13 @@
 """Solution to the day 6 of Advent of Code"""
 
 import argparse
+import math
 import re
 from dataclasses import dataclass
-from functools import reduce
 from typing import Literal
 
+import numpy as np
+
 __author__ = "Wojtek Junior"
 
 INPUT = "input.txt"
@@ -21,6 +23,8 @@ parser.add_argument(
 )
 
 NUMBER_REGEX = re.compile(r"\d+")
+# longest race time for which computations fit in int64 - time^2 < 2^63
+MAX_TIME = 3_000_000_000
 
 
 @dataclass
@@ -88,6 +92,120 @@ class Record:
         )
         return last - first + 1
 
+    def closed_form(self) -> int:
+        """
+        Calculates the number of ways to beat the record from the roots
+        of the quadratic equation press * (time - press) = distance.
+
+        Roots are (time -+ sqrt(time^2 - 4 * distance)) / 2, square root is computed
+        with exact integer arithmetic (math.isqrt), so the result is exact for
+        arbitrarily large numbers. Floor of the root may be off by one from the first
+        winning press, which is corrected by checking the neighbouring presses
+        (middle of the race beats the record, so the correction always stops).
+        Last winning press is symmetrical to the first one.
+
+        The result should be the same as using find_edges but it runs in constant
+        number of integer operations instead of walking through all the presses.
+
+        Returns
+        -------
+        int
+            Number of ways to beat the record.
+        """
+        time, distance = self.time, self.distance
+
+        # highest distance is reached in the middle of the race,
+        # if it doesn't beat the record, none of the presses does
+        middle = time // 2
+        if middle * (time - middle) <= distance:
+            return 0
+
+        discriminant = time * time - 4 * distance
+        first = max((time - math.isqrt(discriminant)) // 2, 0)
+        while first * (time - first) <= distance:
+            first += 1
+        while first > 0 and (first - 1) * (time - first + 1) > distance:
+            first -= 1
+
+        last = time - first
+        return last - first + 1
+
+
+def count_ways(times: np.ndarray, distances: np.ndarray) -> np.ndarray:
+    """
+    Calculates the number of ways to beat the record for many races at once,
+    vectorized version of Record.closed_form.
+
+    Races with non-negative time up to MAX_TIME and non-negative distance are computed
+    with int64 arrays, square root is computed with float64 and the first winning press
+    is then corrected with integer arithmetic. Remaining races (possibly exceeding int64)
+    fall back to exact python ints of Record.closed_form.
+
+    Parameters
+    ----------
+    times : np.ndarray
+        Race times in miliseconds.
+    distances : np.ndarray
+        Record distances to beat in milimeters, same shape as times.
+
+    Returns
+    -------
+    np.ndarray
+        Number of ways to beat the record of each race, int64 if all the races
+        fit in int64, object array with python ints otherwise.
+
+    Raises
+    ------
+    ValueError
+        If times and distances have different shapes.
+    """
+    times = np.asarray(times)
+    distances = np.asarray(distances)
+
+    # python ints beyond int64 are compared in object arrays
+    if times.dtype.kind != "i" or distances.dtype.kind != "i":
+        times = times.astype(object)
+        distances = distances.astype(object)
+
+    if times.shape != distances.shape:
+        raise ValueError(
+            f"Shapes of times {times.shape} and distances {distances.shape} differ"
+        )
+
+    # races which can't be won are left to the wins mask below
+    safe = (
+        (times >= 0)
+        & (times <= MAX_TIME)
+        & (distances >= 0)
+        & (distances <= np.iinfo(np.int64).max)
+    ).astype(bool)
+
+    time = times[safe].astype(np.int64)
+    distance = distances[safe].astype(np.int64)
+
+    middle = time // 2
+    wins = middle * (time - middle) > distance
+    time, distance = time[wins], distance[wins]
+
+    root = np.sqrt((time * time - 4 * distance).astype(np.float64))
+    first = np.maximum((time - root.astype(np.int64)) // 2, 0)
+
+    # middle of the race beats the record, so the corrections always stop
+    while (fix := first * (time - first) <= distance).any():
+        first += fix
+    while (fix := (first > 0) & ((first - 1) * (time - first + 1) > distance)).any():
+        first -= fix
+
+    ways = np.zeros(times.shape, dtype=np.int64 if safe.all() else object)
+    ways.flat[np.flatnonzero(safe.ravel())[wins]] = time - 2 * first + 1
+
+    for i in np.flatnonzero(~safe.ravel()):
+        ways.flat[i] = Record(
+            time=int(times.flat[i]), distance=int(distances.flat[i])
+        ).closed_form()
+
+    return ways
+
 
 def main(part: PART) -> int:
     """
@@ -108,18 +226,19 @@ def main(part: PART) -> int:
         times, distances = map(lambda line: NUMBER_REGEX.findall(line), f.readlines())
 
     if part == 1:
-        records = (
-            Record(time=int(time), distance=int(distance))
-            for time, distance in zip(times, distances)
+        ways = count_ways(
+            np.array([int(time) for time in times]),
+            np.array([int(distance) for distance in distances]),
         )
-        return reduce(lambda x, y: x * y, (record.find_edges() for record in records))
+        # product of python ints, may exceed int64
+        return int(ways.prod(dtype=object))
 
     elif part == 2:
         time = int("".join(times))
         distance = int("".join(distances))
 
         record = Record(time=time, distance=distance)
-        return record.find_edges()
+        return record.closed_form()
 
     else:
         raise ValueError(f"Invalid part of the problem: '{part}', must be 1 or 2.")
@@ -4,8 +4,11 @@ from __future__ import annotations
 
 import argparse
 from collections import Counter
-from dataclasses import dataclass
-from typing import Literal, Optional
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Iterable, Iterator, Literal, Optional
+
+import numpy as np
 
 __author__ = "Wojtek Junior"
 
@@ -36,10 +39,20 @@ class GameSettigns:
         Used for comparison between hands if their figures are the same.
     joker : Optional[str], optional
         Card considered as joker in the game, by default None
+
+    Attributes
+    ----------
+    weights : dict[str, int]
+        Weight of each card in the game - the first card in order has the highest one
+        and the last card has weight 0.
     """
 
     order: list[str]
     joker: Optional[str] = None
+    weights: dict[str, int] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.weights = {card: len(self.order) - 1 - i for i, card in enumerate(self.order)}
 
 
 JOKER = "J"
@@ -55,6 +68,84 @@ SETUPS: dict[int, GameSettigns] = {
     ),
 }
 
+# type of the hand (higher is stronger) by number of cards of each kind in descending order
+HAND_TYPES: dict[tuple[int, ...], int] = {
+    (1, 1, 1, 1, 1): 0,  # high card
+    (2, 1, 1, 1): 1,  # one pair
+    (2, 2, 1): 2,  # two pair
+    (3, 1, 1): 3,  # three of a kind
+    (3, 2): 4,  # full house
+    (4, 1): 5,  # four of a kind
+    (5,): 6,  # five of a kind
+}
+# number of cards in hand
+HAND_SIZE = 5
+
+
+def _partitions(n: int, largest: int) -> Iterator[tuple[int, ...]]:
+    """Counts of cards of the same kind (descending) possible for n cards."""
+    if n == 0:
+        yield ()
+    for first in range(min(n, largest), 0, -1):
+        for rest in _partitions(n - first, first):
+            yield (first, *rest)
+
+
+@lru_cache
+def get_type_table(order: tuple[str, ...], joker: Optional[str] = None) -> np.ndarray:
+    """
+    Builds table with types of all possible hands in the game (see HAND_TYPES),
+    indexed by weights of the cards of the hand as digits in base of number of cards
+    in the game (see GameSettigns.weights). Table is built once per game settings.
+
+    Counts of cards of the same kind are identified by the number of jokers
+    and the number of pairs of equal cards among the other cards - each
+    count c contributes c * (c - 1) / 2 pairs, which differs for all the possible
+    counts of the hand. Jokers (if any) are added to the highest count of other cards.
+    Pairs are counted with comparisons of positions of all the hands at once,
+    without counting cards of each kind.
+
+    Parameters
+    ----------
+    order : tuple[str, ...]
+        Cards in order of their weight in the game.
+    joker : Optional[str], optional
+        Card considered as joker in the game, by default None
+
+    Returns
+    -------
+    np.ndarray
+        Array of uint8 types of hands of shape (len(order) ** HAND_SIZE,).
+    """
+    base = len(order)
+    max_pairs = HAND_SIZE * (HAND_SIZE - 1) // 2
+
+    # type of the hand by number of jokers and number of pairs of other equal cards
+    types = np.zeros((HAND_SIZE + 1, max_pairs + 1), dtype=np.uint8)
+    for jokers in range(HAND_SIZE + 1):
+        for counts in _partitions(HAND_SIZE - jokers, HAND_SIZE):
+            pairs = sum(count * (count - 1) // 2 for count in counts)
+            best = tuple(sorted((counts[0] + jokers, *counts[1:]) if counts else (jokers,)))
+            types[jokers, pairs] = HAND_TYPES[best[::-1]]
+
+    codes = np.arange(base**HAND_SIZE, dtype=np.int32)
+    cards = [
+        (codes // base**position % base).astype(np.int8) for position in range(HAND_SIZE)
+    ]
+
+    # joker weight is out of range of the weights if there is no joker in the game
+    joker_weight = base - 1 - order.index(joker) if joker is not None else base
+    is_joker = [card == joker_weight for card in cards]
+
+    jokers = np.zeros(codes.size, dtype=np.int8)
+    pairs = np.zeros(codes.size, dtype=np.int8)
+    for i in range(HAND_SIZE):
+        jokers += is_joker[i]
+        for j in range(i + 1, HAND_SIZE):
+            pairs += (cards[i] == cards[j]) & ~is_joker[i]
+
+    return types[jokers, pairs]
+
 
 def split_line(line: str) -> tuple[list[str], int]:
     """
@@ -95,8 +186,27 @@ class Hand:
     settings: GameSettigns
 
     def __post_init__(self) -> None:
-        """Sets up hand protected attributes after initialization."""
+        """Sets up hand type and rank key after initialization."""
+        # weights of the cards as digits of a number in base of number of cards in the game
+        code = 0
+        for card in self.cards:
+            code = code * len(self.settings.order) + self.settings.weights[card]
+
+        table = get_type_table(tuple(self.settings.order), self.settings.joker)
+        self.type = int(table[code])
+        self.rank_key = self._get_rank_key(code)
 
+    def _get_rank_key(self, code: int) -> int:
+        """
+        Packs type of the hand and weights of its cards into a single integer,
+        so hands are ordered the same way by the integers as by '__gt__' method.
+        Weights of the cards are the digits of the number in base of number of cards
+        in the game, type of the hand is the most significant digit.
+        """
+        return self.type * len(self.settings.order) ** len(self.cards) + code
+
+    def _count_cards(self) -> Counter:
+        """Counts how many cards of each kind are in hand, with jokers replaced if enabled."""
         # counter of how many cards of each kind are in hand
         cards_count = Counter(self.cards)
 
@@ -110,8 +220,7 @@ class Hand:
                 most_common = max(cards_count.keys(), key=cards_count.__getitem__)
                 cards_count[most_common] += jokers
 
-        self._counter = Counter(cards_count.values())
-        self._cards_count = cards_count
+        return cards_count
 
     @property
     def encoded(self) -> str:
@@ -135,22 +244,120 @@ class Hand:
         str
             Encoded string representation of hand.
         """
-        return "".join([str(self._counter.get(x, 0)) for x in range(len(self.cards), 0, -1)])
+        counter = Counter(self._count_cards().values())
+        return "".join([str(counter.get(x, 0)) for x in range(len(self.cards), 0, -1)])
 
     def __gt__(self, other: Hand) -> bool:
-        if self.encoded == other.encoded:
-            # hand has the same figures - check thier weight
-            return self._gt_order(other)
+        if self.rank_key == other.rank_key:
+            raise ValueError("Equal hands")
+        return self.rank_key > other.rank_key
+
+
+class Ranking:
+    """
+    Ranking of hands keeping total winnings (sum of bid * rank of every hand)
+    up to date after each inserted hand, without sorting all the hands again.
+
+    Hands are stored in two Fenwick trees indexed by rank key - number of hands
+    and sum of their bids with keys lower or equal to the given one are both prefix sums.
+    Inserted hand gets rank one higher than number of hands with lower or equal keys
+    and moves all the hands with higher keys one rank up, which increases
+    the total by sum of their bids. Trees are kept in dicts, storing only
+    the nodes touched by inserted keys.
+
+    Parameters
+    ----------
+    size : int
+        Number of possible rank keys, keys are from 0 to size - 1.
+    """
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.total = 0
+        self._counts: dict[int, int] = {}
+        self._bids: dict[int, int] = {}
+        self._n_hands = 0
+        self._bids_sum = 0
+
+    def __len__(self) -> int:
+        return self._n_hands
+
+    def _prefix(self, key: int) -> tuple[int, int]:
+        """Number of hands and sum of their bids with rank key lower or equal to the key."""
+        count, bids = 0, 0
+        i = key + 1
+        while i > 0:
+            count += self._counts.get(i, 0)
+            bids += self._bids.get(i, 0)
+            i -= i & -i
+        return count, bids
+
+    def insert(self, key: int, bid: int) -> int:
+        """
+        Inserts hand with rank key and bid into the ranking.
+        Hand with equal key to already inserted ones gets rank higher than them.
+
+        Parameters
+        ----------
+        key : int
+            Rank key of the hand, see Hand.rank_key.
+        bid : int
+            Bid for hand.
+
+        Returns
+        -------
+        int
+            Total winnings after inserting the hand.
+
+        Raises
+        ------
+        ValueError
+            If the key is outside of the ranking.
+        """
+        if not 0 <= key < self.size:
+            raise ValueError(f"Key {key} outside of the ranking of size {self.size}")
+
+        count, bids = self._prefix(key)
+        self.total += bid * (count + 1) + (self._bids_sum - bids)
+
+        i = key + 1
+        while i <= self.size:
+            self._counts[i] = self._counts.get(i, 0) + 1
+            self._bids[i] = self._bids.get(i, 0) + bid
+            i += i & -i
+
+        self._n_hands += 1
+        self._bids_sum += bid
+        return self.total
 
-        return self.encoded > other.encoded
 
-    def _gt_order(self, other: Hand) -> bool:
-        """Compares hands based on thier weights in case of equal figures."""
-        for card1, card2 in zip(self.cards, other.cards):
-            if card1 == card2:
-                continue
-            return self.settings.order.index(card1) < self.settings.order.index(card2)
-        raise ValueError("Equal hands")
+def iter_total_winnings(lines: Iterable[str]) -> Iterator[tuple[int, int]]:
+    """
+    Yields total winnings of both parts of the problem after each hand from the lines,
+    as hands arrive one by one.
+
+    Parameters
+    ----------
+    lines : Iterable[str]
+        Lines with hands in format of input file.
+
+    Yields
+    ------
+    tuple[int, int]
+        Total winnings of part 1 and part 2 after the hand.
+    """
+    rankings = {
+        part: Ranking(len(HAND_TYPES) * len(setup.order) ** HAND_SIZE)
+        for part, setup in SETUPS.items()
+    }
+
+    for line in lines:
+        cards, bid = split_line(line.strip("\n"))
+        totals = [
+            ranking.insert(Hand(cards, bid, settings=SETUPS[part]).rank_key, bid)
+            for part, ranking in rankings.items()
+        ]
+        yield totals[0], totals[1]
 
 
 def main(part: PART) -> int:
@@ -173,7 +380,8 @@ def main(part: PART) -> int:
 
     setup = SETUPS[part]
     hands = [Hand(*split_line(line), settings=setup) for line in lines]
-    return sum(hand.bid * index for index, hand in enumerate(sorted(hands), start=1))
+    ranked = sorted(hands, key=lambda hand: hand.rank_key)
+    return sum(hand.bid * index for index, hand in enumerate(ranked, start=1))
 
 
 if __name__ == "__main__":
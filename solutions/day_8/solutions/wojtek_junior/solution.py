@@ -5,18 +5,30 @@ from __future__ import annotations
 import argparse
 import math
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from functools import reduce
 from itertools import cycle
 from typing import Callable, Iterable, Literal, Optional
 
+import numpy as np
+
 __author__ = "Wojtek Junior"
 
 INPUT = "input.txt"
 PART = Literal[1, 2]
+# possible methods to use for the part 2 of the solution
+# crt - cycle of each ghost is analyzed and combined with chinese remainder theorem
+# lcm - least common multiple of the steps to the first end node of each ghost
+# simulate - all the ghosts walk together step by step, up to MAX_STEPS
+METHOD = Literal["crt", "lcm", "simulate"]
+
+# limit of steps for simulation of the ghosts
+MAX_STEPS = 10_000_000
 
 # direction to navigate the edges of node - go left or right
 INSTRUCTION = Literal["L", "R"]
+# index of the direction in successors of the Network
+DIRECTIONS = {"L": 0, "R": 1}
 
 # regex for the node code
 CODE_REGEX = re.compile(r"^[A-Z]{3}")
@@ -31,6 +43,13 @@ parser.add_argument(
     type=int,
     help="Part of the daily problem - 1 or 2",
 )
+parser.add_argument(
+    "-m",
+    "--method",
+    default="crt",
+    type=str,
+    help="Method to use for the part 2 of the solution - one of: 'crt', 'lcm' or 'simulate'",
+)
 
 
 @dataclass
@@ -139,7 +158,451 @@ def parse_graph(lines: list) -> dict[str, Node]:
     return nodes
 
 
-def main(part: PART) -> int:
+@dataclass
+class GhostCycle:
+    """
+    Dataclass describing steps at which a single ghost is at the target node.
+    Walk of the ghost is a prefix followed by a cycle, both made of full passes
+    of the instructions, as the state of the walk repeats when the same node is
+    visited at the start of the pass.
+
+    Parameters
+    ----------
+    prefix : list[int]
+        Steps reaching the target before the cycle starts.
+    offsets : list[int]
+        Steps reaching the target during the first round of the cycle,
+        in minimal period of the steps (see get_minimal_period).
+    start : int
+        Number of steps before the cycle starts.
+    period : int
+        Number of steps after which the steps reaching the target repeat.
+    """
+
+    prefix: list[int]
+    offsets: list[int]
+    start: int
+    period: int
+
+    def is_hit(self, step: int) -> bool:
+        """Checks if the ghost is at the target node after the number of steps."""
+        if step <= self.start:
+            return step in self.prefix
+        return (step - self.start - 1) % self.period + self.start + 1 in self.offsets
+
+
+def get_minimal_period(offsets: list[int], period: int) -> int:
+    """
+    Returns the smallest divisor of the period under which the offsets repeat -
+    shifting all of them by it (modulo period) gives the same set of offsets.
+    Walk of the ghost may loop many times within one round of its cycle
+    (e.g. loop of nodes independent of the instructions), so the offsets
+    repeat much more often than the cycle of (node, instruction index) states.
+
+    Parameters
+    ----------
+    offsets : list[int]
+        Steps reaching the target during one round of the cycle.
+    period : int
+        Number of steps of one round of the cycle.
+
+    Returns
+    -------
+    int
+        Minimal period of the offsets.
+    """
+    residues = {offset % period for offset in offsets}
+    divisors = sorted(
+        divisor
+        for d in range(1, math.isqrt(period) + 1)
+        if period % d == 0
+        for divisor in (d, period // d)
+    )
+
+    for divisor in divisors:
+        # each residue repeats period // divisor times within the round
+        if len(residues) % (period // divisor):
+            continue
+        if all((residue + divisor) % period in residues for residue in residues):
+            return divisor
+    return period
+
+
+def combine_congruences(
+    first: tuple[int, int], second: tuple[int, int]
+) -> Optional[tuple[int, int]]:
+    """
+    Combines two congruences x = r1 (mod m1) and x = r2 (mod m2)
+    into a single one with generalized chinese remainder theorem (moduli don't have
+    to be coprime).
+
+    Parameters
+    ----------
+    first : tuple[int, int]
+        Remainder and modulus of the first congruence.
+    second : tuple[int, int]
+        Remainder and modulus of the second congruence.
+
+    Returns
+    -------
+    Optional[tuple[int, int]]
+        Remainder and modulus (least common multiple of moduli) of the combined congruence,
+        None if congruences have no common solution.
+    """
+    (r1, m1), (r2, m2) = first, second
+    g = math.gcd(m1, m2)
+
+    if (r2 - r1) % g:
+        return None
+
+    modulus = m1 // g * m2
+    k = (r2 - r1) // g * pow(m1 // g, -1, m2 // g) % (m2 // g)
+    return (r1 + m1 * k) % modulus, modulus
+
+
+def solve_ghosts(cycles: list[GhostCycle]) -> int:
+    """
+    Returns the lowest number of steps after which all the ghosts are
+    at the target nodes at the same time.
+
+    Either the step is in the prefix of one of the ghosts - all of them are
+    checked directly, or all the ghosts are in their cycles - one offset of each ghost
+    is chosen and congruences (step = offset mod period) are combined with
+    chinese remainder theorem, lowest solution after all the prefixes is taken.
+    Ghosts with fewer offsets are combined first, so that inconsistent
+    combinations are dropped as early as possible.
+
+    Parameters
+    ----------
+    cycles : list[GhostCycle]
+        Cycles of all the ghosts.
+
+    Returns
+    -------
+    int
+        Number of steps.
+
+    Raises
+    ------
+    ValueError
+        If ghosts are never at the target nodes at the same time.
+    """
+    candidates = [
+        step
+        for ghost in cycles
+        for step in ghost.prefix
+        if all(other.is_hit(step) for other in cycles)
+    ]
+
+    congruences: set[tuple[int, int]] = {(0, 1)}
+    for ghost in sorted(cycles, key=lambda ghost: len(ghost.offsets)):
+        congruences = {
+            combined
+            for congruence in congruences
+            for offset in ghost.offsets
+            if (combined := combine_congruences(congruence, (offset, ghost.period)))
+        }
+
+    # first step at which all the ghosts are in their cycles
+    lowest = max((ghost.start + 1 for ghost in cycles), default=1)
+    for remainder, modulus in congruences:
+        candidates.append(lowest + (remainder - lowest) % modulus)
+
+    if not candidates:
+        raise ValueError("Ghosts never reach the end nodes at the same time")
+    return min(candidates)
+
+
+@dataclass
+class Network:
+    """
+    Graph compiled into arrays of integers - nodes are indexed by position in codes.
+    Besides the single steps, it stores where each node lands after one full pass
+    of the instructions, so long walks are done pass by pass and not step by step.
+
+    Parameters
+    ----------
+    codes : list[str]
+        Codes of the nodes, index of the code is the index of the node.
+    successors : np.ndarray
+        Index of the next node for each direction (see DIRECTIONS) and node,
+        shape (2, n_nodes).
+    instructions : np.ndarray
+        Directions to follow as indexes of DIRECTIONS, shape (n_instructions,).
+    """
+
+    codes: list[str]
+    successors: np.ndarray
+    instructions: np.ndarray
+    # nodes after 2^k passes of the instructions, built lazily - see Network.jump
+    _jumps: list[np.ndarray] = field(default_factory=list, init=False, repr=False)
+
+    @classmethod
+    def from_lines(cls, instructions: str, lines: list[str]) -> Network:
+        """
+        Parses the network from the input.
+
+        Parameters
+        ----------
+        instructions : str
+            Instructions to follow, string of L and R.
+        lines : list[str]
+            List of input lines with nodes.
+
+        Returns
+        -------
+        Network
+            Compiled network.
+
+        Raises
+        ------
+        ValueError
+            If any of the nodes leads to the node which is not defined.
+        """
+        edges = {}
+        for line in lines:
+            code = CODE_REGEX.search(line).group()  # type: ignore
+            edges[code] = DIRECTION_REGEX.findall(line)
+
+        index = {code: i for i, code in enumerate(edges)}
+        missing = {code for pair in edges.values() for code in pair} - index.keys()
+        if missing:
+            raise ValueError(f"Nodes not defined in the network: {sorted(missing)}")
+
+        successors = np.array(
+            [
+                [index[left] for left, _ in edges.values()],
+                [index[right] for _, right in edges.values()],
+            ],
+            dtype=np.int64,
+        ).reshape(2, len(index))
+        return cls(
+            codes=list(edges),
+            successors=successors,
+            instructions=np.array(
+                [DIRECTIONS[char] for char in instructions], dtype=np.int64
+            ),
+        )
+
+    def index(self, code: str) -> int:
+        """Index of the node with the code."""
+        return self.codes.index(code)
+
+    def nodes_where(self, condition: Callable[[str], bool]) -> np.ndarray:
+        """Boolean array, True for nodes with code satisfying the condition."""
+        return np.array([condition(code) for code in self.codes], dtype=bool)
+
+    @property
+    def passes(self) -> np.ndarray:
+        """Index of the node reached after one full pass of the instructions from each node."""
+        return self.jump(0)
+
+    def first_hits(self, targets: np.ndarray) -> np.ndarray:
+        """
+        Calculates for each node the first step (1 to number of instructions)
+        of a single pass of the instructions that reaches any of the target nodes,
+        all the nodes are walked at once.
+
+        Parameters
+        ----------
+        targets : np.ndarray
+            Boolean array, True for target nodes.
+
+        Returns
+        -------
+        np.ndarray
+            First step reaching the target, -1 if not reached during the pass.
+        """
+        nodes = np.arange(len(self.codes))
+        hits = np.full(nodes.size, -1, dtype=np.int64)
+
+        for step, instruction in enumerate(self.instructions, start=1):
+            nodes = self.successors[instruction, nodes]
+            hits[(hits < 0) & targets[nodes]] = step
+        return hits
+
+    def jump(self, k: int) -> np.ndarray:
+        """
+        Index of the node reached after 2^k full passes of the instructions from each node.
+        Tables are built lazily by doubling the previous one (binary lifting).
+        """
+        if not self._jumps:
+            nodes = np.arange(len(self.codes))
+            for instruction in self.instructions:
+                nodes = self.successors[instruction, nodes]
+            self._jumps.append(nodes)
+
+        while len(self._jumps) <= k:
+            last = self._jumps[-1]
+            self._jumps.append(last[last])
+        return self._jumps[k]
+
+    def walk(self, start: int, steps: int) -> int:
+        """
+        Returns the index of the node reached after the number of steps from the start.
+        Full passes of the instructions are done with binary lifting
+        and only the remaining steps of the last pass are walked one by one.
+
+        Parameters
+        ----------
+        start : int
+            Index of the starting node.
+        steps : int
+            Number of steps to walk.
+
+        Returns
+        -------
+        int
+            Index of the node reached.
+        """
+        passes, rest = divmod(steps, self.instructions.size)
+        node = start
+
+        k = 0
+        while passes:
+            if passes & 1:
+                node = int(self.jump(k)[node])
+            passes >>= 1
+            k += 1
+
+        for instruction in self.instructions[:rest]:
+            node = int(self.successors[instruction, node])
+        return node
+
+    def ghost_cycle(self, start: int, targets: np.ndarray) -> GhostCycle:
+        """
+        Finds the prefix and the cycle of the walk from the start node
+        (see GhostCycle) with all the steps reaching the target nodes in them.
+
+        Parameters
+        ----------
+        start : int
+            Index of the starting node.
+        targets : np.ndarray
+            Boolean array, True for target nodes.
+
+        Returns
+        -------
+        GhostCycle
+            Cycle of the walk.
+        """
+        passes = self.passes
+        # pass at which the node was visited at the start of the pass
+        visited: dict[int, int] = {}
+        node = start
+
+        while node not in visited:
+            visited[node] = len(visited)
+            node = int(passes[node])
+
+        # steps of all the visited passes at once, hits[step - 1, pass]
+        nodes = np.array(list(visited), dtype=np.int64)
+        hits = np.zeros((self.instructions.size, nodes.size), dtype=bool)
+        for step, instruction in enumerate(self.instructions):
+            nodes = self.successors[instruction, nodes]
+            hits[step] = targets[nodes]
+
+        n_prefix = visited[node]
+        steps = [
+            n_pass * self.instructions.size + step + 1
+            for step, n_pass in zip(*np.nonzero(hits))
+        ]
+        start_step = n_prefix * self.instructions.size
+        offsets = sorted(step for step in steps if step > start_step)
+        period = (len(visited) - n_prefix) * self.instructions.size
+
+        # only the offsets of the first round of the minimal period are needed
+        period = get_minimal_period(offsets, period)
+        return GhostCycle(
+            prefix=sorted(step for step in steps if step <= start_step),
+            offsets=[offset for offset in offsets if offset <= start_step + period],
+            start=start_step,
+            period=period,
+        )
+
+    def simulate_ghosts(
+        self, starts: np.ndarray, targets: np.ndarray, max_steps: int = MAX_STEPS
+    ) -> int:
+        """
+        Returns the number of steps after which all the ghosts are at the target nodes
+        at the same time, walking all of them together. Steps of one pass
+        of the instructions are walked as a block - positions of all the ghosts
+        after each step are stored in an array and checked for targets at once.
+
+        Brute force, mostly useful to validate other methods on small networks.
+
+        Parameters
+        ----------
+        starts : np.ndarray
+            Indexes of the starting nodes of the ghosts.
+        targets : np.ndarray
+            Boolean array, True for target nodes.
+        max_steps : int, optional
+            Maximum number of steps to walk, by default MAX_STEPS.
+
+        Returns
+        -------
+        int
+            Number of steps.
+
+        Raises
+        ------
+        ValueError
+            If ghosts don't reach the target nodes at the same time within max_steps.
+        """
+        positions = np.asarray(starts, dtype=np.int64)
+        block = self.instructions.size
+        walked = np.empty((block, positions.size), dtype=np.int64)
+
+        for offset in range(0, max_steps, block):
+            for step, instruction in enumerate(self.instructions):
+                positions = self.successors[instruction, positions]
+                walked[step] = positions
+
+            all_hit = np.flatnonzero(targets[walked].all(axis=1))
+            if all_hit.size and offset + all_hit[0] + 1 <= max_steps:
+                return offset + int(all_hit[0]) + 1
+
+        raise ValueError(
+            f"Ghosts don't reach the end nodes at the same time in {max_steps} steps"
+        )
+
+    def steps_to(self, start: int, targets: np.ndarray) -> int:
+        """
+        Returns the number of steps to reach any of the target nodes from the start,
+        walking pass by pass until the pass which reaches the target.
+
+        Parameters
+        ----------
+        start : int
+            Index of the starting node.
+        targets : np.ndarray
+            Boolean array, True for target nodes.
+
+        Returns
+        -------
+        int
+            Number of steps to reach the target.
+
+        Raises
+        ------
+        ValueError
+            If the target is never reached from the start.
+        """
+        hits = self.first_hits(targets)
+        passes = self.passes
+        node = start
+
+        # after visiting every node at the start of a pass, walk is in a loop
+        for n_passes in range(len(self.codes) + 1):
+            if hits[node] >= 0:
+                return n_passes * self.instructions.size + int(hits[node])
+            node = passes[node]
+
+        raise ValueError(f"Target is never reached from the node {self.codes[start]}")
+
+
+def main(part: PART, method: METHOD = "crt") -> int:
     """
     Calculates the solution to the problem from Day 8.
 
@@ -147,6 +610,8 @@ def main(part: PART) -> int:
     ----------
     part : PART
         Part of the daily problem - 1 or 2.
+    method : METHOD
+        Method to use for the part 2 - one of: 'crt', 'lcm' or 'simulate', by default "crt".
 
     Returns
     -------
@@ -159,18 +624,24 @@ def main(part: PART) -> int:
     # instructions to follow are in the first line
     instructions = lines[0].strip("\n")
     # nodes of the graph start form the third line of input file
-    nodes = parse_graph(lines[2:])
+    network = Network.from_lines(instructions, lines[2:])
 
     if part == 1:
-        start = nodes["AAA"]
-
-        return get_steps(
-            start=start,
-            instructions=instructions,
-            condition=lambda x: x.code == "ZZZ",
+        return network.steps_to(
+            start=network.index("AAA"),
+            targets=network.nodes_where(lambda code: code == "ZZZ"),
         )
 
-    elif part == 2:
+    elif part == 2 and method == "crt":
+        targets = network.nodes_where(lambda code: code.endswith("Z"))
+        cycles = [
+            network.ghost_cycle(start=start, targets=targets)
+            for start, code in enumerate(network.codes)
+            if code.endswith("A")
+        ]
+        return solve_ghosts(cycles)
+
+    elif part == 2 and method == "lcm":
 
         def lcm_multiple(*args):
             """Calculates the least common multiple of multiple numbers."""
@@ -180,14 +651,11 @@ def main(part: PART) -> int:
 
             return reduce(lcm, args)
 
-        start = [node for code, node in nodes.items() if code.endswith("A")]
+        targets = network.nodes_where(lambda code: code.endswith("Z"))
         steps = [
-            get_steps(
-                start=start,
-                instructions=instructions,
-                condition=lambda x: x.code.endswith("Z"),
-            )
-            for start in start
+            network.steps_to(start=start, targets=targets)
+            for start, code in enumerate(network.codes)
+            if code.endswith("A")
         ]
         # based on the assumption that following the set of intructions, starting from
         # any of the start nodes, graph will be traversed in the same number of steps.
@@ -196,11 +664,21 @@ def main(part: PART) -> int:
         # end node from all of the start nodes at the same time.
         return lcm_multiple(*steps)
 
+    elif part == 2 and method == "simulate":
+        starts = np.flatnonzero(network.nodes_where(lambda code: code.endswith("A")))
+        targets = network.nodes_where(lambda code: code.endswith("Z"))
+        return network.simulate_ghosts(starts=starts, targets=targets)
+
+    elif part == 2:
+        raise ValueError(
+            f"Unknown method: {method}, choose one of: 'crt', 'lcm' or 'simulate'"
+        )
+
     else:
         raise ValueError(f"Invalid part of the problem: '{part}', must be 1 or 2.")
 
 
 if __name__ == "__main__":
     args = parser.parse_args()
-    result = main(part=args.part)
+    result = main(part=args.part, method=args.method)
     print(result)
@@ -0,0 +1,30 @@
+"""Regression checks of the day 8 part 2 solvers on generated input."""
+
+import importlib.util
+import math
+import sys
+from pathlib import Path
+
+from tools.generators import day_8
+
+SOLUTION = Path(__file__).parents[1] / "solutions/day_8/solutions/wojtek_junior/solution.py"
+
+spec = importlib.util.spec_from_file_location("day_8_wojtek_junior", SOLUTION)
+solution = importlib.util.module_from_spec(spec)  # type: ignore
+# dataclasses look up the module of the class by its name
+sys.modules[spec.name] = solution  # type: ignore
+spec.loader.exec_module(solution)  # type: ignore
+
+
+def test_crt_on_scaled_input():
+    # ghosts of generated input loop many times within one cycle of states
+    lines = [line.rstrip("\n") for line in day_8.generate(scale=10, seed=1)]
+
+    network = solution.Network.from_lines(lines[0], lines[2:])
+    targets = network.nodes_where(lambda code: code.endswith("Z"))
+    starts = [i for i, code in enumerate(network.codes) if code.endswith("A")]
+    result = solution.solve_ghosts([network.ghost_cycle(i, targets) for i in starts])
+
+    # each ghost reaches its end node every length steps, the first time after length steps
+    expected = math.lcm(*(network.steps_to(i, targets) for i in starts))
+    assert result == expected
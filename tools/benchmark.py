@@ -0,0 +1,603 @@
+"""
+Script for benchmarking competing implementations of the same day.
+
+Each implementation of the day is run against the same input file.
+Module is copied into a temporary directory together with the input saved under
+every input file name the module refers to, so that both cwd-relative
+and module-relative paths of every author resolve to the same data.
+
+Every run is repeated after warmup runs and summarized with statistics
+of wall time. Implementations solving the parts in separate runs pay interpreter
+startup once per run, so startup of an empty module is measured the same way
+and subtracted from every run when picking the fastest implementation.
+Only implementations with results for every requested part are compared.
+Results can be stored as a baseline in a versioned JSON file and later runs
+are compared against it, flagging regressions above the threshold.
+
+CLI Arguments
+-------------
+days: list[int]
+    Days of the advent calendar to benchmark, by default all discovered days.
+parts: list[int]
+    Parts of the daily problem to benchmark, by default both.
+input: str
+    Path to the input file shared by all implementations, by default
+    input of the first implementation of the day.
+warmup: int
+    Number of runs discarded before timing.
+repeat: int
+    Number of timed runs.
+timeout: float
+    Timeout of a single run in seconds.
+baseline: str
+    Path to the JSON file with baseline results.
+threshold: float
+    Relative slowdown of median time flagged as a regression.
+update: bool
+    If set, results are saved as a new baseline.
+
+Usage
+-----
+>>> python -m tools.benchmark --days 1 --repeat 10
+>>> python -m tools.benchmark --update
+>>> python -m tools.benchmark -d 4 -i my_input.txt --threshold 0.1
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import re
+import shutil
+import statistics
+import sys
+import tempfile
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from itertools import groupby
+from typing import Iterable, Optional
+
+from tools.runner import PARTS, ROOT, Solution, discover, execute
+
+# version of the baseline file schema
+VERSION = 1
+BASELINE = os.path.join(ROOT, "benchmarks", "baseline.json")
+
+# string literal with the name of the input file in the solution module
+INPUT_REGEX = re.compile(r"""["']([^"']*?\.txt)["']""")
+
+parser = argparse.ArgumentParser(description="Benchmark implementations of the days")
+parser.add_argument(
+    "-d",
+    "--days",
+    nargs="+",
+    type=int,
+    default=None,
+    help="Days of the advent calendar to benchmark, by default all",
+)
+parser.add_argument(
+    "-p",
+    "--parts",
+    nargs="+",
+    type=int,
+    choices=list(PARTS),
+    default=list(PARTS),
+    help="Parts of the daily problem to benchmark - 1 and/or 2",
+)
+parser.add_argument(
+    "-i",
+    "--input",
+    default=None,
+    type=str,
+    help="Input file shared by all the implementations, by default input of the first one",
+)
+parser.add_argument("--warmup", default=1, type=int, help="Number of warmup runs")
+parser.add_argument("-r", "--repeat", default=5, type=int, help="Number of timed runs")
+parser.add_argument(
+    "-t",
+    "--timeout",
+    default=60.0,
+    type=float,
+    help="Timeout of a single run in seconds",
+)
+parser.add_argument(
+    "-b",
+    "--baseline",
+    default=BASELINE,
+    type=str,
+    help="Path to the JSON file with baseline results",
+)
+parser.add_argument(
+    "--threshold",
+    default=0.2,
+    type=float,
+    help="Relative slowdown of the median flagged as a regression",
+)
+parser.add_argument(
+    "-u",
+    "--update",
+    action="store_true",
+    help="Save the results as a new baseline",
+)
+
+
+@dataclass
+class Benchmark:
+    """
+    Dataclass with statistics of repeated runs of one implementation.
+
+    Parameters
+    ----------
+    day : int
+        Day of the advent calendar.
+    solution : str
+        Name of the solution in form of `author/module.py`.
+    part : int, optional
+        Part of the problem, None if the script solves both parts in one run.
+    median : float
+        Median wall time in seconds.
+    mean : float
+        Mean wall time in seconds.
+    stdev : float
+        Standard deviation of wall time in seconds.
+    min : float
+        Minimal wall time in seconds.
+    cpu : float
+        Median CPU time in seconds.
+    repeat : int
+        Number of timed runs.
+    """
+
+    day: int
+    solution: str
+    part: Optional[int]
+    median: float
+    mean: float
+    stdev: float
+    min: float
+    cpu: float
+    repeat: int
+
+    @property
+    def key(self) -> str:
+        """Key of the benchmark in the baseline file."""
+        part = self.part if self.part is not None else "all"
+        return f"day_{self.day}/{self.solution}/part_{part}"
+
+
+def get_input_names(solution: Solution) -> list[str]:
+    """
+    Returns names of the input files the solution module refers to.
+
+    Parameters
+    ----------
+    solution : Solution
+        Solution to get input file names for.
+
+    Returns
+    -------
+    list[str]
+        Base names of the input files.
+    """
+    with open(solution.path, "r", encoding="utf-8") as f:
+        source = f.read()
+    return sorted({os.path.basename(name) for name in INPUT_REGEX.findall(source)})
+
+
+def get_default_input(solutions: list[Solution]) -> str:
+    """
+    Returns path to the input of the first implementation that has one.
+
+    Parameters
+    ----------
+    solutions : list[Solution]
+        Implementations of the same day.
+
+    Returns
+    -------
+    str
+        Path to the input file.
+
+    Raises
+    ------
+    ValueError
+        If none of the implementations has an input file in its directory.
+    """
+    for solution in solutions:
+        for name in get_input_names(solution):
+            path = os.path.join(os.path.dirname(solution.path), name)
+            if os.path.isfile(path):
+                return path
+
+    raise ValueError(f"No input file found for day '{solutions[0].day}'.")
+
+
+def stage(solution: Solution, input_path: str, directory: str) -> str:
+    """
+    Copies solution module into the directory and saves the input under
+    every name the module refers to.
+
+    Parameters
+    ----------
+    solution : Solution
+        Solution to stage.
+    input_path : str
+        Path to the input file shared by all implementations.
+    directory : str
+        Directory to stage the solution in.
+
+    Returns
+    -------
+    str
+        Path to the staged module.
+    """
+    path = os.path.join(directory, os.path.basename(solution.path))
+    shutil.copyfile(solution.path, path)
+
+    for name in get_input_names(solution):
+        shutil.copyfile(input_path, os.path.join(directory, name))
+
+    return path
+
+
+def benchmark(
+    solution: Solution,
+    part: Optional[int],
+    input_path: str,
+    warmup: int = 1,
+    repeat: int = 5,
+    timeout: Optional[float] = None,
+) -> Benchmark:
+    """
+    Runs the solution repeatedly against the input and collects statistics.
+
+    Parameters
+    ----------
+    solution : Solution
+        Solution to benchmark.
+    part : int, optional
+        Part of the problem, None to run the script without arguments.
+    input_path : str
+        Path to the input file.
+    warmup : int, optional
+        Number of runs discarded before timing, by default 1.
+    repeat : int, optional
+        Number of timed runs, by default 5.
+    timeout : float, optional
+        Timeout of a single run in seconds, by default None (no timeout).
+
+    Returns
+    -------
+    Benchmark
+        Statistics of the timed runs.
+
+    Raises
+    ------
+    RuntimeError
+        If any of the runs failed or timed out.
+    """
+    args = ["--part", str(part)] if part is not None else []
+    walls, cpus = [], []
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = stage(solution, input_path=input_path, directory=directory)
+
+        for i in range(warmup + repeat):
+            status, _, wall, cpu, output = execute(
+                path=path, args=args, cwd=directory, timeout=timeout
+            )
+            if status != "ok":
+                raise RuntimeError(
+                    f"Run of '{solution.name}' finished with {status}: {output}"
+                )
+            if i >= warmup:
+                walls.append(wall)
+                cpus.append(cpu)
+
+    return Benchmark(
+        day=solution.day,
+        solution=solution.name,
+        part=part,
+        median=statistics.median(walls),
+        mean=statistics.mean(walls),
+        stdev=statistics.stdev(walls) if len(walls) > 1 else 0.0,
+        min=min(walls),
+        cpu=statistics.median(cpus),
+        repeat=repeat,
+    )
+
+
+def measure_startup(
+    warmup: int = 1, repeat: int = 5, timeout: Optional[float] = None
+) -> float:
+    """
+    Measures median wall time of running an empty module - cost of the interpreter
+    startup included in every run of a solution.
+
+    Parameters
+    ----------
+    warmup : int, optional
+        Number of runs discarded before timing, by default 1.
+    repeat : int, optional
+        Number of timed runs, by default 5.
+    timeout : float, optional
+        Timeout of a single run in seconds, by default None (no timeout).
+
+    Returns
+    -------
+    float
+        Median wall time of the empty run in seconds.
+    """
+    walls = []
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "empty.py")
+        open(path, "w").close()
+
+        for i in range(warmup + repeat):
+            _, _, wall, _, _ = execute(path=path, args=[], cwd=directory, timeout=timeout)
+            if i >= warmup:
+                walls.append(wall)
+
+    return statistics.median(walls)
+
+
+def load_baseline(path: str) -> dict[str, dict]:
+    """
+    Loads baseline results from the JSON file.
+
+    Parameters
+    ----------
+    path : str
+        Path to the baseline file.
+
+    Returns
+    -------
+    dict[str, dict]
+        Baseline statistics by benchmark key, empty if the file does not exist.
+
+    Raises
+    ------
+    ValueError
+        If the version of the file is not supported.
+    """
+    if not os.path.exists(path):
+        return {}
+
+    with open(path, "r") as f:
+        content = json.load(f)
+
+    if content.get("version") != VERSION:
+        raise ValueError(
+            f"Unsupported baseline version: '{content.get('version')}', expected {VERSION}."
+        )
+    return content["benchmarks"]
+
+
+def save_baseline(path: str, benchmarks: Iterable[Benchmark]) -> None:
+    """
+    Saves results as the baseline, keeping entries of benchmarks not run this time.
+
+    Parameters
+    ----------
+    path : str
+        Path to the baseline file.
+    benchmarks : Iterable[Benchmark]
+        Results to save.
+    """
+    stored = load_baseline(path)
+    stored.update({b.key: asdict(b) for b in benchmarks})
+
+    directory = os.path.dirname(path)
+    if directory and not os.path.exists(directory):
+        os.makedirs(directory)
+
+    content = {
+        "version": VERSION,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "benchmarks": dict(sorted(stored.items())),
+    }
+    with open(path, "w") as f:
+        json.dump(content, f, indent=2)
+        f.write("\n")
+
+
+def format_report(
+    benchmarks: list[Benchmark],
+    baseline: dict[str, dict],
+    threshold: float,
+    startup: float = 0.0,
+    parts: Iterable[int] = PARTS,
+) -> tuple[str, list[Benchmark]]:
+    """
+    Formats results as a table with comparison to the baseline
+    and the fastest implementation of each day.
+
+    Parameters
+    ----------
+    benchmarks : list[Benchmark]
+        Results of the benchmarks.
+    baseline : dict[str, dict]
+        Baseline statistics by benchmark key.
+    threshold : float
+        Relative slowdown of median flagged as a regression.
+    startup : float, optional
+        Wall time of the interpreter startup subtracted from each run
+        when comparing implementations, by default 0.0.
+    parts : Iterable[int], optional
+        Parts requested for the benchmark, by default both. Only implementations
+        with results for all of them are compared.
+
+    Returns
+    -------
+    tuple[str, list[Benchmark]]
+        Report and list of regressed benchmarks.
+    """
+    width = max([len(b.solution) for b in benchmarks] + [len("solution")])
+    header = (
+        f"{'day':>3}  {'solution':<{width}}  {'part':>4}  {'median':>9}  {'mean':>9}  "
+        f"{'stdev':>9}  {'min':>9}  {'baseline':>9}  {'change':>8}"
+    )
+    rows, regressions = [], []
+
+    for day, group in groupby(benchmarks, key=lambda b: b.day):
+        group = list(group)
+        rows += ["", header, "-" * len(header)]
+
+        for b in group:
+            part = b.part if b.part is not None else "-"
+            row = (
+                f"{b.day:>3}  {b.solution:<{width}}  {part:>4}  {b.median:>9.4f}  "
+                f"{b.mean:>9.4f}  {b.stdev:>9.4f}  {b.min:>9.4f}"
+            )
+
+            stored = baseline.get(b.key)
+            if stored is not None:
+                change = b.median / stored["median"] - 1
+                row += f"  {stored['median']:>9.4f}  {change:>+8.1%}"
+                if change > threshold:
+                    regressions.append(b)
+                    row += "  REGRESSION"
+
+            rows.append(row)
+
+        # implementations solve both parts in different number of runs - compare totals
+        # without the interpreter startup paid once per run
+        totals: dict[str, float] = {}
+        covered: dict[str, set[Optional[int]]] = {}
+        for b in group:
+            totals[b.solution] = totals.get(b.solution, 0.0) + max(b.median - startup, 0.0)
+            covered.setdefault(b.solution, set()).add(b.part)
+
+        # solutions with a failed part would be judged on less work, scripts without
+        # the part option solve both parts anyway, so they are fair only if both were run
+        complete = [set(parts)]
+        if set(parts) == set(PARTS):
+            complete.append({None})
+        totals = {s: total for s, total in totals.items() if covered[s] in complete}
+
+        if totals:
+            fastest = min(totals, key=totals.__getitem__)
+            rows.append(
+                f"fastest implementation: {fastest} "
+                f"({totals[fastest]:0.4f} s without startup)"
+            )
+        else:
+            rows.append("fastest implementation: none with results for all parts")
+
+    rows += ["", f"interpreter startup: {startup:0.4f} s per run"]
+    return "\n".join(rows).lstrip("\n"), regressions
+
+
+def main(
+    days: Optional[list[int]] = None,
+    parts: Iterable[int] = PARTS,
+    input_path: Optional[str] = None,
+    warmup: int = 1,
+    repeat: int = 5,
+    timeout: Optional[float] = None,
+    baseline: str = BASELINE,
+    threshold: float = 0.2,
+    update: bool = False,
+) -> int:
+    """
+    Benchmarks implementations of the days and compares them with the baseline.
+
+    Parameters
+    ----------
+    days : list[int], optional
+        Days to benchmark, by default all discovered days.
+    parts : Iterable[int], optional
+        Parts of the problem to benchmark, by default both.
+    input_path : str, optional
+        Input file shared by all implementations, by default
+        input of the first implementation of each day.
+    warmup : int, optional
+        Number of runs discarded before timing, by default 1.
+    repeat : int, optional
+        Number of timed runs, by default 5.
+    timeout : float, optional
+        Timeout of a single run in seconds, by default None (no timeout).
+    baseline : str, optional
+        Path to the baseline file.
+    threshold : float, optional
+        Relative slowdown of the median flagged as a regression, by default 0.2.
+    update : bool, optional
+        If True, results are saved as the new baseline, by default False.
+
+    Returns
+    -------
+    int
+        Exit code - 0 if there are no regressions, 1 otherwise.
+    """
+    solutions = discover(days=days)
+    parts = list(parts)
+
+    if input_path is not None and len({s.day for s in solutions}) > 1:
+        raise ValueError("Input file can be provided only when benchmarking a single day.")
+
+    benchmarks = []
+
+    for day, group in groupby(solutions, key=lambda s: s.day):
+        group = list(group)
+        day_input = input_path or get_default_input(group)
+
+        for solution in group:
+            for part in solution.get_parts(parts):
+                try:
+                    result = benchmark(
+                        solution,
+                        part=part,
+                        input_path=day_input,
+                        warmup=warmup,
+                        repeat=repeat,
+                        timeout=timeout,
+                    )
+                except RuntimeError as e:
+                    name = solution.name if part is None else f"{solution.name} part {part}"
+                    print(f"Skipping {name} of day {day}, {e}", file=sys.stderr)
+                    continue
+                benchmarks.append(result)
+
+    if not benchmarks:
+        print("No benchmarks were run.")
+        return 0
+
+    startup = measure_startup(warmup=warmup, repeat=repeat, timeout=timeout)
+    report, regressions = format_report(
+        benchmarks,
+        baseline=load_baseline(baseline),
+        threshold=threshold,
+        startup=startup,
+        parts=parts,
+    )
+    print(report)
+
+    if update:
+        save_baseline(baseline, benchmarks)
+        print(f"\nBaseline saved to '{baseline}'.")
+
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) above {threshold:.0%} threshold.")
+
+    return int(bool(regressions))
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    code = main(
+        days=args.days,
+        parts=args.parts,
+        input_path=args.input,
+        warmup=args.warmup,
+        repeat=args.repeat,
+        timeout=args.timeout,
+        baseline=args.baseline,
+        threshold=args.threshold,
+        update=args.update,
+    )
+    sys.exit(code)
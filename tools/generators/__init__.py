@@ -0,0 +1,88 @@
+"""
+Generators of synthetic inputs for the solved days of the advent calendar.
+
+Each generator emits input in the exact format of the real one, with the size
+multiplied by the scale (from 1x up to 10,000x), and is reproducible for the seed.
+"""
+
+from typing import Callable, Iterator, Optional
+
+from tools.generators import (
+    day_1,
+    day_2,
+    day_3,
+    day_4,
+    day_5,
+    day_6,
+    day_7,
+    day_8,
+    day_9,
+    day_10,
+    day_11,
+    day_13,
+    day_15,
+)
+
+GENERATOR = Callable[[int, Optional[int]], Iterator[str]]
+
+GENERATORS: dict[int, GENERATOR] = {
+    1: day_1.generate,
+    2: day_2.generate,
+    3: day_3.generate,
+    4: day_4.generate,
+    5: day_5.generate,
+    6: day_6.generate,
+    7: day_7.generate,
+    8: day_8.generate,
+    9: day_9.generate,
+    10: day_10.generate,
+    11: day_11.generate,
+    13: day_13.generate,
+    15: day_15.generate,
+}
+
+
+def get_generator(day: int) -> GENERATOR:
+    """
+    Returns generator of the input for the day.
+
+    Parameters
+    ----------
+    day : int
+        Day of the advent calendar.
+
+    Returns
+    -------
+    GENERATOR
+        Function taking scale and seed and yielding lines of the input.
+
+    Raises
+    ------
+    ValueError
+        If there is no generator for the day.
+    """
+    generator = GENERATORS.get(day)
+    if generator is None:
+        raise ValueError(f"No generator for day '{day}', available: {sorted(GENERATORS)}.")
+    return generator
+
+
+def write_input(day: int, path: str, scale: int = 1, seed: Optional[int] = None) -> None:
+    """
+    Generates input for the day and writes it to the file.
+
+    Parameters
+    ----------
+    day : int
+        Day of the advent calendar.
+    path : str
+        Path to the file to write the input to.
+    scale : int, optional
+        Multiplier of the size of the real input, by default 1.
+    seed : int, optional
+        Seed of the random number generator, by default None.
+    """
+    generator = get_generator(day)
+
+    with open(path, "w") as f:
+        f.writelines(generator(scale, seed))
@@ -0,0 +1,57 @@
+"""
+Script for generating synthetic input for the day of the advent calendar.
+
+CLI Arguments
+-------------
+day: int
+    The day of the advent calendar to generate input for.
+scale: int
+    Multiplier of the size of the real input.
+seed: int
+    Seed of the random number generator.
+output: str
+    Path to the file to write the input to, by default printed to stdout.
+
+Usage
+-----
+>>> python -m tools.generators --day 5 --scale 100 --seed 1 -o input.txt
+>>> python -m tools.generators -d 7 -s 10
+"""
+
+import argparse
+import sys
+
+from tools.generators import get_generator, write_input
+
+parser = argparse.ArgumentParser(description="Generate synthetic input of the day")
+parser.add_argument(
+    "-d",
+    "--day",
+    required=True,
+    type=int,
+    help="Day of the advent calendar",
+)
+parser.add_argument(
+    "-s",
+    "--scale",
+    default=1,
+    type=int,
+    help="Multiplier of the size of the real input",
+)
+parser.add_argument("--seed", default=None, type=int, help="Seed of the random generator")
+parser.add_argument(
+    "-o",
+    "--output",
+    default=None,
+    type=str,
+    help="Path to the file to write the input to, by default stdout",
+)
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+
+    if args.output is not None:
+        write_input(day=args.day, path=args.output, scale=args.scale, seed=args.seed)
+    else:
+        sys.stdout.writelines(get_generator(args.day)(args.scale, args.seed))
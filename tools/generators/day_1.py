@@ -0,0 +1,52 @@
+"""
+Generator of the input for day 1 - calibration document.
+
+Each line mixes random letters, digits and spelled digits
+and contains at least one digit, so both parts of the problem can be solved.
+"""
+
+import string
+from typing import Iterator, Optional
+
+from tools.generators.utils import get_random
+
+# number of lines in the real input
+LINES = 1000
+WORDS = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+DIGITS = "123456789"
+
+
+def generate(scale: int = 1, seed: Optional[int] = None) -> Iterator[str]:
+    """
+    Generates lines of the calibration document.
+
+    Parameters
+    ----------
+    scale : int, optional
+        Multiplier of the number of lines of the real input, by default 1.
+    seed : int, optional
+        Seed of the random number generator, by default None.
+
+    Yields
+    ------
+    str
+        Single line of the input with a trailing newline.
+    """
+    rng = get_random(scale, seed)
+
+    for _ in range(LINES * scale):
+        tokens = []
+
+        for _ in range(rng.randint(1, 6)):
+            kind = rng.random()
+            if kind < 0.45:
+                tokens.append(
+                    "".join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 6)))
+                )
+            elif kind < 0.75:
+                tokens.append(rng.choice(WORDS))
+            else:
+                tokens.append(rng.choice(DIGITS))
+
+        tokens.insert(rng.randint(0, len(tokens)), rng.choice(DIGITS))
+        yield "".join(tokens) + "\n"
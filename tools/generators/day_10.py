@@ -0,0 +1,121 @@
+"""
+Generator of the input for day 10 - pipe maze.
+
+Main loop is the boundary of a random region of lattice cells between the tiles,
+grown one cell at a time. Cell is added only if the region cells among its eight
+neighbours form a single run containing an orthogonal neighbour, which keeps
+the region without holes and pinches, so its boundary is a simple closed loop.
+Remaining tiles are filled with random pipes, apart from the tiles next to
+the start, which could otherwise look connected to it.
+"""
+
+import math
+from random import Random
+from typing import Iterator, Optional
+
+from tools.generators.utils import get_random
+
+# side of the square grid of the real input
+SIDE = 140
+# share of the lattice cells covered by the region enclosed in the loop
+COVERAGE = 0.45
+JUNK = "|-LJ7F."
+
+# neighbours of the cell in cyclic order - N, NE, E, SE, S, SW, W, NW
+NEIGHBOURS = [(-1, 0), (-1, 1), (0, 1), (1, 1), (1, 0), (1, -1), (0, -1), (-1, -1)]
+PIPES = {
+    frozenset("NS"): "|",
+    frozenset("EW"): "-",
+    frozenset("NE"): "L",
+    frozenset("NW"): "J",
+    frozenset("SW"): "7",
+    frozenset("SE"): "F",
+}
+
+
+def _grow_region(size: int, target: int, rng: Random) -> set[tuple[int, int]]:
+    """Grows a region of cells of the size x size lattice with simple boundary."""
+    center = (size // 2, size // 2)
+    region = {center}
+    # cells next to the region - candidates to be added
+    frontier = [(center[0] + dr, center[1] + dc) for dr, dc in NEIGHBOURS[::2]]
+
+    def addable(row: int, col: int) -> bool:
+        inside = [(row + dr, col + dc) in region for dr, dc in NEIGHBOURS]
+        runs = sum(1 for i in range(8) if inside[i] and not inside[i - 1])
+        # orthogonal neighbours are placed on even positions
+        return runs == 1 and any(inside[::2])
+
+    while frontier and len(region) < target:
+        index = rng.randrange(len(frontier))
+        frontier[index], frontier[-1] = frontier[-1], frontier[index]
+        cell = frontier.pop()
+
+        if cell in region or not addable(*cell):
+            # rejected cell comes back to the frontier once its neighbour is added
+            continue
+
+        region.add(cell)
+        for dr, dc in NEIGHBOURS[::2]:
+            row, col = cell[0] + dr, cell[1] + dc
+            if 0 <= row < size and 0 <= col < size and (row, col) not in region:
+                frontier.append((row, col))
+
+    return region
+
+
+def generate(scale: int = 1, seed: Optional[int] = None) -> Iterator[str]:
+    """
+    Generates rows of the pipe maze with a single loop going through the start `S`.
+
+    Parameters
+    ----------
+    scale : int, optional
+        Multiplier of the number of tiles of the real input, by default 1.
+    seed : int, optional
+        Seed of the random number generator, by default None.
+
+    Yields
+    ------
+    str
+        Single row of the maze with a trailing newline.
+    """
+    rng = get_random(scale, seed)
+    side = round(SIDE * math.sqrt(scale))
+    region = _grow_region(side - 1, target=int(COVERAGE * (side - 1) ** 2), rng=rng)
+
+    # directions of the loop going through each of the tiles
+    loop: dict[tuple[int, int], set[str]] = {}
+
+    def connect(first: tuple[int, int], second: tuple[int, int], direction: str) -> None:
+        opposite = {"N": "S", "S": "N", "E": "W", "W": "E"}[direction]
+        loop.setdefault(first, set()).add(direction)
+        loop.setdefault(second, set()).add(opposite)
+
+    for row, col in region:
+        # cell (row, col) lies between tiles (row, col) and (row + 1, col + 1)
+        if (row - 1, col) not in region:
+            connect((row, col), (row, col + 1), "E")
+        if (row + 1, col) not in region:
+            connect((row + 1, col), (row + 1, col + 1), "E")
+        if (row, col - 1) not in region:
+            connect((row, col), (row + 1, col), "S")
+        if (row, col + 1) not in region:
+            connect((row, col + 1), (row + 1, col + 1), "S")
+
+    start = rng.choice(sorted(loop))
+    blocked = {(start[0] + dr, start[1] + dc) for dr, dc in NEIGHBOURS[::2]}
+
+    for row in range(side):
+        tiles = []
+        for col in range(side):
+            tile = (row, col)
+            if tile == start:
+                tiles.append("S")
+            elif tile in loop:
+                tiles.append(PIPES[frozenset(loop[tile])])
+            elif tile in blocked:
+                tiles.append(".")
+            else:
+                tiles.append(rng.choice(JUNK))
+        yield "".join(tiles) + "\n"
@@ -0,0 +1,48 @@
+"""
+Generator of the input for day 11 - image of galaxies.
+
+Image is a square grid (solutions rely on equal number of rows and columns)
+with some of the rows and columns left empty to be expanded.
+"""
+
+import math
+from typing import Iterator, Optional
+
+from tools.generators.utils import get_random
+
+# side of the square grid of the real input
+SIDE = 140
+# probability of the galaxy in the cell and of the row / column being empty
+GALAXY_PROBABILITY = 0.025
+EMPTY_PROBABILITY = 0.06
+
+
+def generate(scale: int = 1, seed: Optional[int] = None) -> Iterator[str]:
+    """
+    Generates rows of the image.
+
+    Parameters
+    ----------
+    scale : int, optional
+        Multiplier of the number of cells of the real input, by default 1.
+    seed : int, optional
+        Seed of the random number generator, by default None.
+
+    Yields
+    ------
+    str
+        Single row of the image with a trailing newline.
+    """
+    rng = get_random(scale, seed)
+    side = round(SIDE * math.sqrt(scale))
+    empty_cols = {col for col in range(side) if rng.random() < EMPTY_PROBABILITY}
+
+    for _ in range(side):
+        if rng.random() < EMPTY_PROBABILITY:
+            yield "." * side + "\n"
+            continue
+
+        yield "".join(
+            "#" if col not in empty_cols and rng.random() < GALAXY_PROBABILITY else "."
+            for col in range(side)
+        ) + "\n"
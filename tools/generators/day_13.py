@@ -0,0 +1,101 @@
+"""
+Generator of the input for day 13 - patterns of ash and rocks.
+
+Each pattern has exactly one perfect reflection line (part 1)
+and exactly one reflection line with a single smudge (part 2).
+Pattern is symmetric about both lines and then a single cell without a mirror
+image across the first line is flipped, which breaks symmetry about the second
+line only. Patterns with accidental additional reflections are drawn again.
+"""
+
+from typing import Iterator, Optional
+
+from tools.generators.utils import get_random
+
+# number of patterns in the real input and range of their sides
+PATTERNS = 100
+SIDES = (5, 17)
+
+
+def _reflections(lines: list[str], differences: int) -> list[int]:
+    """Returns positions of horizontal lines with given number of mirror differences."""
+    found = []
+    for index in range(1, len(lines)):
+        pairs = zip(reversed(lines[:index]), lines[index:])
+        if sum(a != b for top, bottom in pairs for a, b in zip(top, bottom)) == differences:
+            found.append(index)
+    return found
+
+
+def _count(lines: list[str], differences: int) -> int:
+    """Counts horizontal and vertical reflection lines with given number of differences."""
+    transposed = ["".join(column) for column in zip(*lines)]
+    return len(_reflections(lines, differences)) + len(_reflections(transposed, differences))
+
+
+def _pattern(rng) -> list[str]:
+    """Draws a single pattern with unique perfect and smudged reflection."""
+    while True:
+        height, width = rng.randint(*SIDES), rng.randint(*SIDES)
+        row, col = rng.randint(1, height - 1), rng.randint(1, width - 1)
+
+        # cells symmetric about both lines share the value - union of the orbits
+        parent = {(r, c): (r, c) for r in range(height) for c in range(width)}
+
+        def find(cell):
+            while parent[cell] != cell:
+                parent[cell] = parent[parent[cell]]
+                cell = parent[cell]
+            return cell
+
+        for r, c in list(parent):
+            for mirror in ((2 * row - 1 - r, c), (r, 2 * col - 1 - c)):
+                if mirror in parent:
+                    parent[find(mirror)] = find((r, c))
+
+        values = {}
+        grid = [
+            [values.setdefault(find((r, c)), rng.choice("#.")) for c in range(width)]
+            for r in range(height)
+        ]
+
+        unmirrored = [r for r in range(height) if not 0 <= 2 * row - 1 - r < height]
+        if not unmirrored:
+            continue
+
+        r, c = rng.choice(unmirrored), rng.randrange(width)
+        if not 0 <= 2 * col - 1 - c < width:
+            continue
+        grid[r][c] = "#" if grid[r][c] == "." else "."
+
+        lines = ["".join(line) for line in grid]
+        if rng.random() < 0.5:
+            lines = ["".join(column) for column in zip(*lines)]
+
+        if _count(lines, 0) == 1 and _count(lines, 1) == 1:
+            return lines
+
+
+def generate(scale: int = 1, seed: Optional[int] = None) -> Iterator[str]:
+    """
+    Generates lines of the patterns separated by empty lines.
+
+    Parameters
+    ----------
+    scale : int, optional
+        Multiplier of the number of patterns of the real input, by default 1.
+    seed : int, optional
+        Seed of the random number generator, by default None.
+
+    Yields
+    ------
+    str
+        Single line of the input with a trailing newline.
+    """
+    rng = get_random(scale, seed)
+
+    for index in range(PATTERNS * scale):
+        if index:
+            yield "\n"
+        for line in _pattern(rng):
+            yield line + "\n"
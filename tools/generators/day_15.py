@@ -0,0 +1,46 @@
+"""
+Generator of the input for day 15 - initialization sequence.
+
+Sequence is a single line of comma separated steps, either removing
+the lens (`label-`) or setting its focal length (`label=5`).
+"""
+
+from typing import Iterator, Optional
+
+from tools.generators.utils import get_random
+
+# number of steps and distinct labels in the real input
+STEPS = 4000
+LABELS = 500
+REMOVE_PROBABILITY = 0.35
+
+
+def generate(scale: int = 1, seed: Optional[int] = None) -> Iterator[str]:
+    """
+    Generates the sequence of steps in chunks.
+
+    Parameters
+    ----------
+    scale : int, optional
+        Multiplier of the number of steps of the real input, by default 1.
+    seed : int, optional
+        Seed of the random number generator, by default None.
+
+    Yields
+    ------
+    str
+        Single step of the sequence with a separator, the last one with a newline.
+    """
+    rng = get_random(scale, seed)
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    labels = list(
+        dict.fromkeys(
+            "".join(rng.choices(letters, k=rng.randint(2, 6))) for _ in range(LABELS * scale)
+        )
+    )
+    steps = STEPS * scale
+
+    for index in range(steps):
+        label = rng.choice(labels)
+        operation = "-" if rng.random() < REMOVE_PROBABILITY else f"={rng.randint(1, 9)}"
+        yield label + operation + ("," if index < steps - 1 else "\n")
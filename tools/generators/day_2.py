@@ -0,0 +1,49 @@
+"""
+Generator of the input for day 2 - log of cube games.
+
+Every game reveals each of the colors at least once,
+so the maximum number of cubes is defined for every color.
+"""
+
+from typing import Iterator, Optional
+
+from tools.generators.utils import get_random
+
+# number of games in the real input
+GAMES = 100
+COLORS = ["red", "green", "blue"]
+MAX_CUBES = 20
+
+
+def generate(scale: int = 1, seed: Optional[int] = None) -> Iterator[str]:
+    """
+    Generates lines of the game log in form of
+    `Game 1: 3 blue, 4 red; 1 red, 2 green, 6 blue; 2 green`.
+
+    Parameters
+    ----------
+    scale : int, optional
+        Multiplier of the number of games of the real input, by default 1.
+    seed : int, optional
+        Seed of the random number generator, by default None.
+
+    Yields
+    ------
+    str
+        Single line of the input with a trailing newline.
+    """
+    rng = get_random(scale, seed)
+
+    for id_ in range(1, GAMES * scale + 1):
+        draws = [rng.sample(COLORS, k=rng.randint(1, 3)) for _ in range(rng.randint(1, 6))]
+
+        # every color has to be revealed at least once in the game
+        for color in COLORS:
+            if not any(color in draw for draw in draws):
+                rng.choice(draws).append(color)
+
+        moves = "; ".join(
+            ", ".join(f"{rng.randint(1, MAX_CUBES)} {color}" for color in draw)
+            for draw in draws
+        )
+        yield f"Game {id_}: {moves}\n"
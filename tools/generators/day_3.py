@@ -0,0 +1,59 @@
+"""
+Generator of the input for day 3 - engine schematic.
+
+Schematic is a square grid of numbers, symbols and dots (empty cells),
+with area scaled by the multiplier. Numbers in the same row are always
+separated by at least one non-digit cell.
+"""
+
+import math
+from typing import Iterator, Optional
+
+from tools.generators.utils import get_random
+
+# side of the square grid of the real input
+SIDE = 140
+SYMBOLS = "*#+$/@=%&-"
+# probability of starting a number / placing a symbol in the empty cell
+NUMBER_PROBABILITY = 0.09
+SYMBOL_PROBABILITY = 0.04
+
+
+def generate(scale: int = 1, seed: Optional[int] = None) -> Iterator[str]:
+    """
+    Generates rows of the schematic.
+
+    Parameters
+    ----------
+    scale : int, optional
+        Multiplier of the number of cells of the real input, by default 1.
+    seed : int, optional
+        Seed of the random number generator, by default None.
+
+    Yields
+    ------
+    str
+        Single row of the schematic with a trailing newline.
+    """
+    rng = get_random(scale, seed)
+    side = round(SIDE * math.sqrt(scale))
+
+    for _ in range(side):
+        row: list[str] = []
+
+        while len(row) < side:
+            draw = rng.random()
+            length = rng.randint(1, 3)
+
+            if draw < NUMBER_PROBABILITY and len(row) + length <= side:
+                row.append(rng.choice("123456789"))
+                row.extend(rng.choices("0123456789", k=length - 1))
+                # cell after the number must not be a digit
+                if len(row) < side:
+                    row.append(rng.choice(SYMBOLS) if rng.random() < 0.2 else ".")
+            elif draw < NUMBER_PROBABILITY + SYMBOL_PROBABILITY:
+                row.append(rng.choice(SYMBOLS))
+            else:
+                row.append(".")
+
+        yield "".join(row) + "\n"
@@ -0,0 +1,52 @@
+"""
+Generator of the input for day 4 - scratchcards.
+
+Number of matches of each card never exceeds the number of cards below it,
+so copies won in part 2 never go past the end of the table.
+"""
+
+from typing import Iterator, Optional
+
+from tools.generators.utils import get_random
+
+# number of cards in the real input
+CARDS = 198
+WINNING = 10
+GUESSES = 25
+NUMBERS = range(1, 100)
+# distribution of the number of matches on the card
+MATCHES = [0, 0, 0, 0, 1, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+
+
+def generate(scale: int = 1, seed: Optional[int] = None) -> Iterator[str]:
+    """
+    Generates lines of the scratchcards table in form of
+    `Card   1: 41 48 83 86 17 | 83 86  6 31 17  9 48 53 ...`.
+
+    Parameters
+    ----------
+    scale : int, optional
+        Multiplier of the number of cards of the real input, by default 1.
+    seed : int, optional
+        Seed of the random number generator, by default None.
+
+    Yields
+    ------
+    str
+        Single line of the input with a trailing newline.
+    """
+    rng = get_random(scale, seed)
+    cards = CARDS * scale
+    width = max(3, len(str(cards)))
+
+    for index in range(cards):
+        numbers = rng.sample(NUMBERS, k=WINNING + GUESSES)
+        winning = numbers[:WINNING]
+        matches = min(rng.choice(MATCHES), cards - index - 1)
+
+        guesses = winning[:matches] + numbers[WINNING : WINNING + GUESSES - matches]
+        rng.shuffle(guesses)
+
+        left = " ".join(f"{number:>2}" for number in winning)
+        right = " ".join(f"{number:>2}" for number in guesses)
+        yield f"Card {index + 1:>{width}}: {left} | {right}\n"
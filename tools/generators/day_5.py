@@ -0,0 +1,73 @@
+"""
+Generator of the input for day 5 - almanac.
+
+Each of the seven maps consists of non-overlapping source ranges
+mapped onto non-overlapping destination ranges of the same lengths.
+"""
+
+from typing import Iterator, Optional
+
+from tools.generators.utils import get_random
+
+# number of seeds and ranges in each map of the real input
+SEEDS = 20
+RANGES = (10, 45)
+# upper bound of the numbers in the almanac
+LIMIT = 2**32
+CATEGORIES = [
+    "seed",
+    "soil",
+    "fertilizer",
+    "water",
+    "light",
+    "temperature",
+    "humidity",
+    "location",
+]
+
+
+def generate(scale: int = 1, seed: Optional[int] = None) -> Iterator[str]:
+    """
+    Generates lines of the almanac - seeds followed by the maps.
+
+    Parameters
+    ----------
+    scale : int, optional
+        Multiplier of the number of seeds and ranges of the real input, by default 1.
+    seed : int, optional
+        Seed of the random number generator, by default None.
+
+    Yields
+    ------
+    str
+        Single line of the input with a trailing newline.
+    """
+    rng = get_random(scale, seed)
+
+    seeds = []
+    for _ in range(SEEDS * scale // 2):
+        start = rng.randrange(LIMIT)
+        seeds += [start, rng.randint(1, min(LIMIT - start, LIMIT // 8))]
+
+    yield f"seeds: {' '.join(map(str, seeds))}\n"
+
+    for source, destination in zip(CATEGORIES, CATEGORIES[1:]):
+        yield "\n"
+        yield f"{source}-to-{destination} map:\n"
+
+        ranges = rng.randint(*RANGES) * scale
+        bounds = sorted(rng.sample(range(1, LIMIT), k=ranges)) + [LIMIT]
+        segments = [(start, end - start) for start, end in zip([0] + bounds, bounds)]
+
+        # destinations are the same segments laid out in different order
+        order = segments.copy()
+        rng.shuffle(order)
+        destinations, position = [], 0
+        for _, length in order:
+            destinations.append(position)
+            position += length
+
+        mapped = list(zip(destinations, [s for s, _ in order], [n for _, n in order]))
+        # some of the segments are left unmapped (mapped to themselves)
+        for dst, src, length in rng.sample(mapped, k=len(mapped) * 4 // 5):
+            yield f"{dst} {src} {length}\n"
@@ -0,0 +1,41 @@
+"""
+Generator of the input for day 6 - race records.
+
+Every record distance is lower than the best possible distance of the race,
+so each race can be won in at least one way.
+"""
+
+from typing import Iterator, Optional
+
+from tools.generators.utils import get_random
+
+# number of races in the real input
+RACES = 4
+TIMES = (7, 99)
+
+
+def generate(scale: int = 1, seed: Optional[int] = None) -> Iterator[str]:
+    """
+    Generates two lines of the input with times and record distances of the races.
+
+    Parameters
+    ----------
+    scale : int, optional
+        Multiplier of the number of races of the real input, by default 1.
+    seed : int, optional
+        Seed of the random number generator, by default None.
+
+    Yields
+    ------
+    str
+        Single line of the input with a trailing newline.
+    """
+    rng = get_random(scale, seed)
+
+    times = [rng.randint(*TIMES) for _ in range(RACES * scale)]
+    # best distance is reached by holding the button for half of the race
+    distances = [rng.randint(t * t // 8, (t // 2) * (t - t // 2) - 1) for t in times]
+
+    widths = [max(len(str(t)), len(str(d))) + 3 for t, d in zip(times, distances)]
+    yield "Time:    " + "".join(f"{t:>{w}}" for t, w in zip(times, widths)) + "\n"
+    yield "Distance:" + "".join(f"{d:>{w}}" for d, w in zip(distances, widths)) + "\n"
@@ -0,0 +1,54 @@
+"""
+Generator of the input for day 7 - hands of Camel Cards with bids.
+
+Hands are unique, as equal hands cannot be ordered, so the input cannot
+have more hands than there are combinations of five cards (13^5).
+"""
+
+from typing import Iterator, Optional
+
+from tools.generators.utils import get_random
+
+# number of hands in the real input
+HANDS = 1000
+CARDS = "23456789TJQKA"
+HAND_SIZE = 5
+MAX_BID = 1000
+
+
+def generate(scale: int = 1, seed: Optional[int] = None) -> Iterator[str]:
+    """
+    Generates lines of the input in form of `32T3K 765`.
+
+    Parameters
+    ----------
+    scale : int, optional
+        Multiplier of the number of hands of the real input, by default 1.
+    seed : int, optional
+        Seed of the random number generator, by default None.
+
+    Yields
+    ------
+    str
+        Single line of the input with a trailing newline.
+
+    Raises
+    ------
+    ValueError
+        If more hands are requested than there are unique hands.
+    """
+    rng = get_random(scale, seed)
+    combinations = len(CARDS) ** HAND_SIZE
+    hands = HANDS * scale
+
+    if hands > combinations:
+        raise ValueError(
+            f"Cannot generate {hands} unique hands, there are only {combinations} of them."
+        )
+
+    for code in rng.sample(range(combinations), k=hands):
+        cards = []
+        for _ in range(HAND_SIZE):
+            code, index = divmod(code, len(CARDS))
+            cards.append(CARDS[index])
+        yield f"{''.join(cards)} {rng.randint(1, MAX_BID)}\n"
@@ -0,0 +1,85 @@
+"""
+Generator of the input for day 8 - instructions and network of nodes.
+
+Network consists of separate loops, one per ghost. Each loop is a chain of pairs
+of nodes - going left or right from any node of the pair leads to the left or right
+node of the next pair, so the ghost moves by one pair per step regardless
+of the instruction. Start node (`**A`) and end node (`**Z`) share their successors,
+so each ghost reaches its end node every `length` steps, the first time after
+exactly `length` steps. Node `AAA` starts the loop ending in `ZZZ`.
+
+Node codes are three capital letters, which bounds the size of the network,
+so past the real size only the instructions keep growing with the scale.
+"""
+
+import math
+import string
+from itertools import product
+from typing import Iterator, Optional
+
+from tools.generators.utils import get_random
+
+# length of the instructions and number of ghosts in the real input
+INSTRUCTIONS = 283
+GHOSTS = 6
+# range of the loop lengths of the real size input
+LENGTHS = (43, 79)
+# limit of the loop length to stay within the number of available codes
+MAX_LENGTH = 1300
+
+
+def _is_prime(number: int) -> bool:
+    return number > 1 and all(number % i for i in range(2, math.isqrt(number) + 1))
+
+
+def generate(scale: int = 1, seed: Optional[int] = None) -> Iterator[str]:
+    """
+    Generates lines of the input - instructions, empty line and nodes
+    in form of `AAA = (BBB, CCC)`.
+
+    Parameters
+    ----------
+    scale : int, optional
+        Multiplier of the size of the real input, by default 1.
+    seed : int, optional
+        Seed of the random number generator, by default None.
+
+    Yields
+    ------
+    str
+        Single line of the input with a trailing newline.
+    """
+    rng = get_random(scale, seed)
+
+    yield "".join(rng.choices("LR", k=INSTRUCTIONS * scale)) + "\n"
+    yield "\n"
+
+    factor = math.sqrt(scale)
+    low = min(round(LENGTHS[0] * factor), MAX_LENGTH // 2)
+    high = min(round(LENGTHS[1] * factor), MAX_LENGTH)
+    primes = [n for n in range(max(low, 3), high + 1) if _is_prime(n)]
+    lengths = rng.sample(primes, k=GHOSTS)
+
+    letters = string.ascii_uppercase
+    inner = [
+        "".join(code) for code in product(letters, letters, letters) if code[2] not in "AZ"
+    ]
+    rng.shuffle(inner)
+    prefixes = ["".join(code) for code in product(letters, letters)]
+    starts = ["AA"] + rng.sample([p for p in prefixes if p != "AA"], k=GHOSTS - 1)
+    ends = ["ZZ"] + rng.sample([p for p in prefixes if p != "ZZ"], k=GHOSTS - 1)
+
+    nodes = []
+    for ghost, length in enumerate(lengths):
+        start, end = starts[ghost] + "A", ends[ghost] + "Z"
+        pairs = [(inner.pop(), inner.pop()) for _ in range(length - 1)]
+
+        nodes.append((start, pairs[0]))
+        nodes.append((end, pairs[0]))
+        for (left, right), next_ in zip(pairs, pairs[1:] + [(end, end)]):
+            nodes.append((left, next_))
+            nodes.append((right, next_))
+
+    rng.shuffle(nodes)
+    for code, (left, right) in nodes:
+        yield f"{code} = ({left}, {right})\n"
@@ -0,0 +1,45 @@
+"""
+Generator of the input for day 9 - histories of the values.
+
+Each history is a polynomial sequence with integer coefficients,
+of degree low enough for differences to reach all zeros.
+"""
+
+from math import comb
+from typing import Iterator, Optional
+
+from tools.generators.utils import get_random
+
+# number of histories and their length in the real input
+HISTORIES = 200
+LENGTH = 21
+
+
+def generate(scale: int = 1, seed: Optional[int] = None) -> Iterator[str]:
+    """
+    Generates lines of the input with space separated values.
+
+    Parameters
+    ----------
+    scale : int, optional
+        Multiplier of the number of histories of the real input, by default 1.
+    seed : int, optional
+        Seed of the random number generator, by default None.
+
+    Yields
+    ------
+    str
+        Single line of the input with a trailing newline.
+    """
+    rng = get_random(scale, seed)
+
+    for _ in range(HISTORIES * scale):
+        # at least one zero has to be left after taking all the differences
+        degree = rng.randint(1, LENGTH - 2)
+        coefficients = [rng.randint(-10, 30)] + [rng.randint(-9, 9) for _ in range(degree)]
+
+        # polynomial in the binomial basis has integer values in integer points
+        values = [
+            sum(c * comb(x, k) for k, c in enumerate(coefficients)) for x in range(LENGTH)
+        ]
+        yield " ".join(map(str, values)) + "\n"
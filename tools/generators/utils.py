@@ -0,0 +1,30 @@
+"""Utilities shared by the input generators."""
+
+import random
+from typing import Optional
+
+
+def get_random(scale: int, seed: Optional[int]) -> random.Random:
+    """
+    Validates the scale of the input and returns random number generator.
+
+    Parameters
+    ----------
+    scale : int
+        Multiplier of the size of the real input, from 1 up.
+    seed : int, optional
+        Seed of the random number generator, by default None (random).
+
+    Returns
+    -------
+    random.Random
+        Seeded random number generator.
+
+    Raises
+    ------
+    ValueError
+        If the scale is lower than 1.
+    """
+    if scale < 1:
+        raise ValueError(f"Invalid scale of the input: '{scale}', must be at least 1.")
+    return random.Random(seed)
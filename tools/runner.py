@@ -0,0 +1,478 @@
+"""
+Script for running all the solutions of the advent calendar at once.
+
+Discovers every solution module placed in `solutions/day_<N>/solutions/<author>/`
+directory and runs it in a separate process, with the working directory set
+to the directory of the module, so relative input paths are resolved against
+the module itself. Runs are executed in parallel in a pool of processes,
+each of them with a timeout and measured wall and CPU time.
+
+Solutions exposing `-p/--part` argument are run once for each part of the problem,
+scripts without it are run once and are expected to print both parts.
+
+CLI Arguments
+-------------
+days: list[int]
+    Days of the advent calendar to run, by default all discovered days.
+parts: list[int]
+    Parts of the daily problem to run, by default both.
+timeout: float
+    Timeout of a single run in seconds.
+workers: int
+    Number of processes to run solutions in, by default number of CPUs.
+format: str
+    Format of the report - 'table' or 'json'.
+output: str
+    Path to the file to write the report to, by default printed to stdout.
+
+Usage
+-----
+>>> python -m tools.runner
+>>> python -m tools.runner --days 1 5 --parts 2 --timeout 30
+>>> python -m tools.runner -f json -o report.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import resource
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Iterable, Literal, Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SOLUTIONS = os.path.join(ROOT, "solutions")
+
+# directory of the single day of the advent calendar
+DAY_REGEX = re.compile(r"^day_(\d+)$")
+# solution accepting part of the problem as CLI argument
+PART_REGEX = re.compile(r"""["']--part["']""")
+
+PARTS = (1, 2)
+# width of the output column in the table report
+OUTPUT_WIDTH = 40
+
+STATUS = Literal["ok", "error", "timeout"]
+FORMAT = Literal["table", "json"]
+
+parser = argparse.ArgumentParser(description="Run all the solutions of the calendar")
+parser.add_argument(
+    "-d",
+    "--days",
+    nargs="+",
+    type=int,
+    default=None,
+    help="Days of the advent calendar to run, by default all",
+)
+parser.add_argument(
+    "-p",
+    "--parts",
+    nargs="+",
+    type=int,
+    choices=list(PARTS),
+    default=list(PARTS),
+    help="Parts of the daily problem to run - 1 and/or 2",
+)
+parser.add_argument(
+    "-t",
+    "--timeout",
+    type=float,
+    default=60.0,
+    help="Timeout of a single run in seconds",
+)
+parser.add_argument(
+    "-w",
+    "--workers",
+    type=int,
+    default=None,
+    help="Number of processes to run solutions in, by default number of CPUs",
+)
+parser.add_argument(
+    "-f",
+    "--format",
+    default="table",
+    type=str,
+    choices=["table", "json"],
+    help="Format of the report - 'table' or 'json'",
+)
+parser.add_argument(
+    "-o",
+    "--output",
+    default=None,
+    type=str,
+    help="Path to the file to write the report to, by default stdout",
+)
+
+
+@dataclass
+class Solution:
+    """
+    Dataclass representing a single solution module of an author.
+
+    Parameters
+    ----------
+    day : int
+        Day of the advent calendar.
+    author : str
+        Name of the author's directory.
+    path : str
+        Absolute path to the solution module.
+    accepts_part : bool
+        True if the module accepts `-p/--part` argument, False if it is a script
+        solving both parts in a single run.
+    """
+
+    day: int
+    author: str
+    path: str
+    accepts_part: bool
+
+    @property
+    def name(self) -> str:
+        """Name of the solution in form of `author/module.py`."""
+        return f"{self.author}/{os.path.basename(self.path)}"
+
+    def get_parts(self, parts: Iterable[int]) -> list[Optional[int]]:
+        """
+        Returns parts the solution should be run for.
+        None stands for a single run of the script solving both parts.
+
+        Parameters
+        ----------
+        parts : Iterable[int]
+            Requested parts of the daily problem.
+
+        Returns
+        -------
+        list[Optional[int]]
+            List of parts to run the solution for.
+        """
+        return list(parts) if self.accepts_part else [None]
+
+
+@dataclass
+class Run:
+    """
+    Dataclass representing result of a single run of the solution.
+
+    Parameters
+    ----------
+    day : int
+        Day of the advent calendar.
+    solution : str
+        Name of the solution in form of `author/module.py`.
+    part : int, optional
+        Part of the problem, None if the script solves both parts in one run.
+    status : STATUS
+        Status of the run - 'ok', 'error' or 'timeout'.
+    returncode : int, optional
+        Exit code of the process, None in case of timeout.
+    wall : float
+        Wall time of the run in seconds.
+    cpu : float
+        CPU time (user + system) of the run in seconds.
+    output : str
+        Standard output of the run, or the last line of error output if failed.
+    """
+
+    day: int
+    solution: str
+    part: Optional[int]
+    status: STATUS
+    returncode: Optional[int]
+    wall: float
+    cpu: float
+    output: str
+
+
+def discover(root: str = SOLUTIONS, days: Optional[Iterable[int]] = None) -> list[Solution]:
+    """
+    Discovers all the solution modules in `day_<N>/solutions/<author>/` directories.
+
+    Parameters
+    ----------
+    root : str, optional
+        Directory with days of the advent calendar, by default `solutions`.
+    days : Iterable[int], optional
+        Days to discover solutions for, by default all days.
+
+    Returns
+    -------
+    list[Solution]
+        List of discovered solutions sorted by day, author and module name.
+    """
+    selected = set(days) if days is not None else None
+    solutions = []
+
+    for directory in os.listdir(root):
+        matched = DAY_REGEX.match(directory)
+        if matched is None:
+            continue
+
+        day = int(matched.group(1))
+        if selected is not None and day not in selected:
+            continue
+
+        day_solutions = os.path.join(root, directory, "solutions")
+        if not os.path.isdir(day_solutions):
+            continue
+
+        for author in os.listdir(day_solutions):
+            author_dir = os.path.join(day_solutions, author)
+            if not os.path.isdir(author_dir) or author.startswith("__"):
+                continue
+
+            for module in os.listdir(author_dir):
+                if not module.endswith(".py") or module == "__init__.py":
+                    continue
+
+                path = os.path.join(author_dir, module)
+                with open(path, "r", encoding="utf-8") as f:
+                    accepts_part = PART_REGEX.search(f.read()) is not None
+
+                solutions.append(
+                    Solution(day=day, author=author, path=path, accepts_part=accepts_part)
+                )
+
+    return sorted(solutions, key=lambda s: (s.day, s.author, s.path))
+
+
+def execute(
+    path: str, args: list[str], cwd: str, timeout: Optional[float]
+) -> tuple[STATUS, Optional[int], float, float, str]:
+    """
+    Executes python module in a subprocess and measures its wall and CPU time.
+
+    CPU time is measured as the difference of resources used by terminated children
+    of the current process, so the function must not be called concurrently
+    from multiple threads of the same process.
+
+    Parameters
+    ----------
+    path : str
+        Path to the python module to execute.
+    args : list[str]
+        CLI arguments passed to the module.
+    cwd : str
+        Working directory of the subprocess.
+    timeout : float, optional
+        Timeout in seconds after which the subprocess is killed.
+
+    Returns
+    -------
+    tuple[STATUS, Optional[int], float, float, str]
+        Status, exit code, wall time, CPU time and output of the run.
+    """
+    before = resource.getrusage(resource.RUSAGE_CHILDREN)
+    tic = time.perf_counter()
+
+    try:
+        process = subprocess.run(
+            [sys.executable, path, *args],
+            cwd=cwd,
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+        )
+    except subprocess.TimeoutExpired:
+        status, returncode, output = "timeout", None, ""
+    else:
+        returncode = process.returncode
+        if returncode == 0:
+            status, output = "ok", process.stdout.strip()
+        else:
+            errors = process.stderr.strip().splitlines()
+            status, output = "error", errors[-1] if errors else ""
+
+    wall = time.perf_counter() - tic
+    after = resource.getrusage(resource.RUSAGE_CHILDREN)
+    cpu = (after.ru_utime - before.ru_utime) + (after.ru_stime - before.ru_stime)
+    return status, returncode, wall, cpu, output  # type: ignore
+
+
+def run_solution(solution: Solution, part: Optional[int], timeout: Optional[float]) -> Run:
+    """
+    Runs the solution for the part of the problem in its own directory.
+
+    Parameters
+    ----------
+    solution : Solution
+        Solution to run.
+    part : int, optional
+        Part of the problem, None to run the script without arguments.
+    timeout : float, optional
+        Timeout of the run in seconds.
+
+    Returns
+    -------
+    Run
+        Result of the run.
+    """
+    args = ["--part", str(part)] if part is not None else []
+    status, returncode, wall, cpu, output = execute(
+        path=solution.path,
+        args=args,
+        cwd=os.path.dirname(solution.path),
+        timeout=timeout,
+    )
+    return Run(
+        day=solution.day,
+        solution=solution.name,
+        part=part,
+        status=status,
+        returncode=returncode,
+        wall=wall,
+        cpu=cpu,
+        output=output,
+    )
+
+
+def run_all(
+    solutions: list[Solution],
+    parts: Iterable[int] = PARTS,
+    timeout: Optional[float] = None,
+    workers: Optional[int] = None,
+) -> list[Run]:
+    """
+    Runs all the solutions in a pool of processes.
+
+    Each worker of the pool starts one solution at a time, which keeps
+    CPU time measurement of children processes accurate.
+
+    Parameters
+    ----------
+    solutions : list[Solution]
+        Solutions to run.
+    parts : Iterable[int], optional
+        Parts of the problem to run, by default both.
+    timeout : float, optional
+        Timeout of a single run in seconds, by default None (no timeout).
+    workers : int, optional
+        Number of processes in the pool, by default number of CPUs.
+
+    Returns
+    -------
+    list[Run]
+        Results of the runs in order of solutions and parts.
+    """
+    parts = list(parts)
+    tasks = [(s, part) for s in solutions for part in s.get_parts(parts)]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(run_solution, s, part, timeout) for s, part in tasks]
+        return [future.result() for future in futures]
+
+
+def format_table(runs: list[Run]) -> str:
+    """
+    Formats results of the runs as a plain text table.
+
+    Parameters
+    ----------
+    runs : list[Run]
+        Results of the runs.
+
+    Returns
+    -------
+    str
+        Table with one row per run.
+    """
+    width = max([len(run.solution) for run in runs] + [len("solution")])
+    header = (
+        f"{'day':>3}  {'solution':<{width}}  {'part':>4}  {'status':<7}  "
+        f"{'wall [s]':>9}  {'cpu [s]':>9}  output"
+    )
+    rows = [header, "-" * len(header)]
+
+    for run in runs:
+        part = run.part if run.part is not None else "-"
+        output = " | ".join(run.output.splitlines())
+        if len(output) > OUTPUT_WIDTH:
+            output = output[: OUTPUT_WIDTH - 3] + "..."
+
+        rows.append(
+            f"{run.day:>3}  {run.solution:<{width}}  {part:>4}  {run.status:<7}  "
+            f"{run.wall:>9.4f}  {run.cpu:>9.4f}  {output}"
+        )
+
+    return "\n".join(rows)
+
+
+def main(
+    days: Optional[list[int]] = None,
+    parts: Iterable[int] = PARTS,
+    timeout: Optional[float] = None,
+    workers: Optional[int] = None,
+    format: FORMAT = "table",
+    output: Optional[str] = None,
+) -> int:
+    """
+    Runs the solutions and reports the results.
+
+    Parameters
+    ----------
+    days : list[int], optional
+        Days to run, by default all discovered days.
+    parts : Iterable[int], optional
+        Parts of the problem to run, by default both.
+    timeout : float, optional
+        Timeout of a single run in seconds, by default None (no timeout).
+    workers : int, optional
+        Number of processes in the pool, by default number of CPUs.
+    format : FORMAT, optional
+        Format of the report - 'table' or 'json', by default 'table'.
+    output : str, optional
+        Path to the file to write the report to, by default stdout.
+
+    Returns
+    -------
+    int
+        Exit code - 0 if all the runs succeeded, 1 otherwise.
+    """
+    # solutions may run for minutes, invalid format is rejected before that
+    if format not in ("table", "json"):
+        raise ValueError(f"Invalid format of the report: '{format}', must be table or json.")
+
+    solutions = discover(days=days)
+
+    tic = time.perf_counter()
+    runs = run_all(solutions, parts=parts, timeout=timeout, workers=workers)
+    elapsed = time.perf_counter() - tic
+
+    if format == "table":
+        failed = sum(1 for run in runs if run.status != "ok")
+        report = (
+            f"{format_table(runs)}\n\n"
+            f"{len(runs)} runs, {failed} failed, total time: {elapsed:0.4f} seconds"
+        )
+    else:
+        report = json.dumps(
+            {"elapsed": elapsed, "runs": [asdict(run) for run in runs]}, indent=2
+        )
+
+    if output is None:
+        print(report)
+    else:
+        with open(output, "w") as f:
+            f.write(report)
+
+    return int(any(run.status != "ok" for run in runs))
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    code = main(
+        days=args.days,
+        parts=args.parts,
+        timeout=args.timeout,
+        workers=args.workers,
+        format=args.format,
+        output=args.output,
+    )
+    sys.exit(code)